@@ -62,6 +62,20 @@ Stage Filtering (--stage option):
 Debug Mode (--e2e-debug):
     pytest tests/e2e/ --e2e-debug     # Stream Claude output in real-time
 
+Cached Runs (--e2e-cached):
+    pytest tests/e2e/ --e2e-cached    # Replay unchanged Claude runs from cache
+
+Parallel Runs (pytest-xdist):
+    pytest tests/e2e/ -n auto --dist loadgroup
+
+    All staged tests share the "e2e-pipeline" xdist group, so the dependent
+    stage sequence stays on one worker in stage order while other tests are
+    distributed. Each worker creates its own project and log directories.
+    Stage results are shared between the workers of a run through a small
+    memory-mapped file in the pytest cache, so a stage failure on one worker
+    also skips dependent stages on the others. Any other --dist mode could
+    split the stages across workers, so it is rejected with a usage error.
+
 Example Commands for Clear Status Display:
 ------------------------------------------
 
@@ -78,201 +92,61 @@ Example Commands for Clear Status Display:
     pytest -m e2e -v --durations=5
 """
 
+import re
+import shutil
 from dataclasses import dataclass
-from enum import Enum
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING
 
 import pytest
 
-from .helpers import ClaudeRunner, E2EProject, FileVerifier, GitVerifier
-
-
-class StageStatus(Enum):
-    """Enum representing test stage execution status.
-
-    Used by StageTracker to track the execution state of each test stage
-    in the E2E test pipeline. Stages progress through these states during
-    test execution.
-
-    Attributes:
-        PENDING: Stage not yet executed.
-        PASSED: Stage completed successfully.
-        FAILED: Stage failed with an error.
-        SKIPPED: Stage skipped due to dependency failure.
-    """
-
-    PENDING = "pending"
-    """Stage not yet executed."""
-
-    PASSED = "passed"
-    """Stage completed successfully."""
-
-    FAILED = "failed"
-    """Stage failed with error."""
-
-    SKIPPED = "skipped"
-    """Stage skipped due to dependency failure."""
+from .helpers import stage_tracker
 
+if TYPE_CHECKING:
+    # Imported lazily in the fixtures below, so that pytest runs which never
+    # request them (e.g. --collect-only) don't pay for importing the helpers.
+    from .helpers import ClaudeRunner, E2EProject, FileVerifier, GitVerifier
 
-class StageTracker:
-    """Singleton tracking stage execution across test session.
 
-    This class implements a singleton pattern to maintain consistent state
-    across all test stages during an E2E test session. It tracks which stages
-    have passed, failed, or been skipped, and enforces the business rule that
-    if stage N fails, all stages > N are automatically skipped.
+# Cache subdirectory and file name pattern of the shared xdist state files.
+_CACHE_DIR_NAME = "spectra-e2e"
+_STATE_FILE_GLOB = "stage-state-*.bin"
 
-    Attributes:
-        first_failure: Stage number of first failure (None if all passed).
-        stage_status: Dictionary mapping stage numbers to their status.
-
-    State Transitions:
-        PENDING -> PASSED (test passes)
-        PENDING -> FAILED (test fails)
-        PENDING -> SKIPPED (dependency failed)
 
-    Example:
-        >>> tracker = StageTracker.get_instance()
-        >>> tracker.reset()  # Ensure clean state for example
-        >>> tracker.mark_passed(1)
-        >>> tracker.mark_failed(2)
-        >>> tracker.should_skip(3)  # Returns True because stage 2 failed
-        True
+def _init_stage_state(config: pytest.Config) -> None:
+    """Reset stage state for a new session and attach the shared state file.
 
-    Verification of first_failure tracking:
+    The stage tracker may be reused across sessions (e.g. repeated
+    ``pytest.main()`` calls in one interpreter), so state is always reset
+    first. Inside an xdist worker, the tracker is then attached to a file
+    in the pytest cache directory, keyed on the run's ``testrunuid`` so
+    that all workers of one run share it and separate runs never see each
+    other's failures.
 
-        The first_failure attribute correctly records only the first failure
-        and subsequent failures do not override it:
-
-        >>> tracker = StageTracker.get_instance()
-        >>> tracker.reset()  # Start with clean state
-        >>> tracker.first_failure is None  # No failure recorded yet
-        True
-        >>> tracker.mark_failed(2)
-        >>> tracker.first_failure  # First failure is recorded
-        2
-        >>> tracker.mark_failed(4)  # Another stage fails
-        >>> tracker.first_failure  # Still shows the first failure, not overwritten
-        2
-        >>> tracker.mark_failed(1)  # Even an earlier stage number doesn't override
-        >>> tracker.first_failure  # Remains 2 (first chronological failure)
-        2
-
-        The reset() method clears the first_failure:
-
-        >>> tracker.reset()
-        >>> tracker.first_failure is None  # Cleared after reset
-        True
-        >>> tracker.stage_status  # Stage status also cleared
-        {}
+    Args:
+        config: The pytest configuration object.
     """
+    stage_tracker.detach()
+    stage_tracker.reset()
 
-    _instance: "StageTracker | None" = None
-
-    def __new__(cls) -> "StageTracker":
-        """Create or return the singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize the tracker with empty state.
-
-        Only initializes on first call; subsequent calls are no-ops
-        to maintain singleton state.
-        """
-        if self._initialized:
-            return
-        self.first_failure: int | None = None
-        self.stage_status: dict[int, StageStatus] = {}
-        self._initialized = True
-
-    @classmethod
-    def get_instance(cls) -> "StageTracker":
-        """Get the singleton instance of StageTracker.
-
-        Returns:
-            The singleton StageTracker instance.
-        """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
-
-    def mark_passed(self, stage: int) -> None:
-        """Mark a stage as passed.
-
-        Args:
-            stage: The stage number that passed.
-        """
-        self.stage_status[stage] = StageStatus.PASSED
-
-    def mark_failed(self, stage: int) -> None:
-        """Mark a stage as failed and record first failure if applicable.
-
-        When a stage fails, it is recorded as the first failure if no
-        previous failure exists. This triggers automatic skipping of
-        all subsequent stages.
-
-        Args:
-            stage: The stage number that failed.
-        """
-        self.stage_status[stage] = StageStatus.FAILED
-        if self.first_failure is None:
-            self.first_failure = stage
-
-    def mark_skipped(self, stage: int) -> None:
-        """Mark a stage as skipped.
-
-        Args:
-            stage: The stage number to skip.
-        """
-        self.stage_status[stage] = StageStatus.SKIPPED
-
-    def should_skip(self, stage: int) -> bool:
-        """Determine if a stage should be skipped based on prior failures.
-
-        Implements the business rule: if stage N fails, all stages > N
-        are automatically skipped.
-
-        Args:
-            stage: The stage number to check.
-
-        Returns:
-            True if the stage should be skipped, False otherwise.
-        """
-        if self.first_failure is None:
-            return False
-        return stage > self.first_failure
-
-    def get_status(self, stage: int) -> StageStatus:
-        """Get the status of a specific stage.
-
-        Args:
-            stage: The stage number to query.
-
-        Returns:
-            The status of the stage, or PENDING if not tracked yet.
-        """
-        return self.stage_status.get(stage, StageStatus.PENDING)
-
-    def reset(self) -> None:
-        """Reset all tracker state for test isolation.
+    workerinput = getattr(config, "workerinput", None)
+    cache = getattr(config, "cache", None)
+    if workerinput is None or cache is None:
+        return
 
-        Clears all stage statuses and resets first_failure to None.
-        Useful for ensuring clean state between test runs.
-        """
-        self.first_failure = None
-        self.stage_status = {}
+    stage_tracker.attach(
+        cache.mkdir(_CACHE_DIR_NAME)
+        / _STATE_FILE_GLOB.replace("*", workerinput["testrunuid"])
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class E2EConfig:
     """Configuration object parsed from pytest CLI options.
 
     This dataclass holds configuration settings for E2E test execution,
-    including stage filtering, debug mode, and timeout overrides.
+    including stage filtering, debug mode, and timeout overrides. It is
+    built once per session and shared, so it is frozen.
 
     Attributes:
         stage_filter: Range of stages to run (start, end inclusive).
@@ -280,6 +154,8 @@ class E2EConfig:
         debug: Enable debug mode with streaming output.
         timeout_override: Override all stage timeouts in seconds.
             If None, default timeouts are used.
+        cached: Replay successful Claude runs from the pytest cache when
+            the prompt and project state match a previous run.
 
     Validation Rules:
         - stage_filter range must be 1-6 inclusive
@@ -296,6 +172,7 @@ class E2EConfig:
     stage_filter: tuple[int, int] | None = None
     debug: bool = False
     timeout_override: int | None = None
+    cached: bool = False
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization.
@@ -340,6 +217,37 @@ class E2EConfig:
         return start <= stage <= end
 
 
+# Session-wide E2EConfig, built once in pytest_configure.
+_E2E_CONFIG_KEY = pytest.StashKey[E2EConfig]()
+
+# xdist group shared by all staged tests (see pytest_collection_modifyitems).
+_E2E_XDIST_GROUP = "e2e-pipeline"
+
+# Per-item stage number, resolved once in pytest_collection_modifyitems so
+# later hooks don't walk the item's markers again.
+_STAGE_KEY = pytest.StashKey[int | None]()
+
+# Stage number of each staged item by node id, for pytest_runtest_logreport
+# (which only receives the report). Rebuilt on every collection.
+_stage_by_nodeid: dict[str, int] = {}
+
+
+def _get_worker_id(config: pytest.Config) -> str | None:
+    """Return the pytest-xdist worker id, or None outside of an xdist worker.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The worker id (e.g., "gw0") when running inside an xdist worker,
+        otherwise None.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return None
+    return workerinput.get("workerid")
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Register E2E test CLI options with pytest.
 
@@ -357,6 +265,8 @@ def pytest_addoption(parser: pytest.Parser) -> None:
             When enabled, subprocess output is not captured.
         --timeout-all: Override all stage timeouts to the specified number
             of seconds. Useful for slow environments or debugging.
+        --e2e-cached: Replay successful Claude runs from the pytest cache
+            instead of calling the Claude CLI again.
     """
     parser.addoption(
         "--stage",
@@ -388,21 +298,42 @@ def pytest_addoption(parser: pytest.Parser) -> None:
             "Useful for slow environments or when debugging with breakpoints."
         ),
     )
+    parser.addoption(
+        "--e2e-cached",
+        action="store_true",
+        default=False,
+        help=(
+            "Replay successful Claude runs from the pytest cache when the "
+            "prompt and project state match a previous run. Useful when "
+            "iterating on verification code; not for validating the plugin."
+        ),
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
-    """Register custom markers for E2E tests.
+    """Register custom markers and build the session E2EConfig.
 
     This hook registers the custom markers used in E2E tests to avoid
     pytest warnings about unknown markers. Markers are documented in
     the module docstring.
 
+    It resets the stage tracking state for the new session, and parses
+    the E2E command-line options exactly once and stores the
+    resulting E2EConfig on ``config.stash``, where the collection hook and
+    the ``e2e_config`` fixture read it instead of re-parsing.
+
     Args:
         config: The pytest configuration object.
 
+    Raises:
+        pytest.UsageError: If --stage or --timeout-all has an invalid value,
+            or pytest-xdist distributes tests in a mode other than loadgroup.
+
     Registered Markers:
         e2e: Marks tests as end-to-end tests for selective execution.
         stage(num): Marks tests as belonging to a specific workflow stage (1-6).
+        xdist_group(name): Registered so the stage grouping applied during
+            collection does not warn when pytest-xdist is not installed.
     """
     config.addinivalue_line(
         "markers",
@@ -413,6 +344,34 @@ def pytest_configure(config: pytest.Config) -> None:
         "stage(num): marks test as belonging to stage num (1-6). "
         "If stage N fails, stages > N are automatically skipped."
     )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): pytest-xdist group; tests in one group run on "
+        "the same worker (used with --dist loadgroup)."
+    )
+
+    # xdist turns "-n N" into "--dist load" unless a mode is given; only
+    # loadgroup honors the group that keeps the stages on one worker
+    dist = getattr(config.option, "dist", "no")
+    if dist not in ("no", "loadgroup"):
+        raise pytest.UsageError(
+            f"E2E stages depend on each other and must run on one worker; "
+            f"use '--dist loadgroup' instead of '--dist {dist}'."
+        )
+
+    _init_stage_state(config)
+
+    try:
+        config.stash[_E2E_CONFIG_KEY] = E2EConfig(
+            stage_filter=_parse_stage_filter(
+                config.getoption("--stage", default=None)
+            ),
+            debug=config.getoption("--e2e-debug", default=False),
+            timeout_override=config.getoption("--timeout-all", default=None),
+            cached=config.getoption("--e2e-cached", default=False),
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from e
 
 
 def _parse_stage_filter(stage_str: str | None) -> tuple[int, int] | None:
@@ -431,30 +390,30 @@ def _parse_stage_filter(stage_str: str | None) -> tuple[int, int] | None:
         return None
 
     stage_str = stage_str.strip()
+    # A single partition scan splits "N-M"; int() tolerates the surrounding
+    # whitespace, so no per-part strip is needed.
+    start_str, sep, end_str = stage_str.partition("-")
 
-    if "-" in stage_str:
-        # Range format: "N-M"
-        parts = stage_str.split("-")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid stage range format: '{stage_str}'. Use 'N-M'.")
-        try:
-            start = int(parts[0].strip())
-            end = int(parts[1].strip())
-        except ValueError as e:
-            raise ValueError(
-                f"Invalid stage range: '{stage_str}'. Stage numbers must be integers."
-            ) from e
-        return (start, end)
-    else:
+    if not sep:
         # Single stage format: "N"
         try:
-            stage = int(stage_str)
+            stage = int(start_str)
         except ValueError as e:
             raise ValueError(
                 f"Invalid stage: '{stage_str}'. Must be an integer."
             ) from e
         return (stage, stage)
 
+    # Range format: "N-M"
+    if "-" in end_str:
+        raise ValueError(f"Invalid stage range format: '{stage_str}'. Use 'N-M'.")
+    try:
+        return (int(start_str), int(end_str))
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid stage range: '{stage_str}'. Stage numbers must be integers."
+        ) from e
+
 
 def _get_stage_from_item(item: pytest.Item) -> int | None:
     """Extract stage number from a test item's markers.
@@ -477,25 +436,41 @@ def _get_stage_from_item(item: pytest.Item) -> int | None:
 def pytest_collection_modifyitems(
     config: pytest.Config, items: list[pytest.Item]
 ) -> None:
-    """Sort and filter test items by stage number.
+    """Sort, filter and group test items by stage number.
 
     This hook modifies the test collection to:
     1. Sort tests by their stage number (tests without stage marker go last)
     2. Filter out tests that don't match the --stage filter
+    3. Put every staged test in the same xdist group so that, under
+       ``--dist loadgroup``, the dependent stages run on one worker in order
 
     Args:
         config: The pytest configuration object.
         items: List of collected test items (modified in place).
+
+    Raises:
+        pytest.UsageError: If a stage marker names an invalid stage.
     """
-    # Parse the stage filter from CLI options
-    stage_str = config.getoption("--stage", default=None)
-    stage_filter = _parse_stage_filter(stage_str)
+    stage_filter = config.stash[_E2E_CONFIG_KEY].stage_filter
 
-    # Sort items by stage number (None/no stage goes to end)
-    def stage_sort_key(item: pytest.Item) -> tuple[int, str]:
-        """Sort key: (stage_number, test_name). No stage = 999 (last)."""
+    # Resolve each item's stage marker once; every later lookup hits the stash
+    _stage_by_nodeid.clear()
+    for item in items:
         stage = _get_stage_from_item(item)
-        return (stage if stage is not None else 999, item.nodeid)
+        item.stash[_STAGE_KEY] = stage
+        if stage is not None:
+            try:
+                stage_tracker.validate_stage(stage)
+            except ValueError as e:
+                raise pytest.UsageError(f"{item.nodeid}: {e}") from e
+            _stage_by_nodeid[item.nodeid] = stage
+
+    # Sort items by stage number (None/no stage goes to end). list.sort is
+    # stable, so tests within a stage keep their collection order.
+    def stage_sort_key(item: pytest.Item) -> int:
+        """Sort key: stage_number. No stage = 999 (last)."""
+        stage = item.stash[_STAGE_KEY]
+        return stage if stage is not None else 999
 
     items.sort(key=stage_sort_key)
 
@@ -504,7 +479,7 @@ def pytest_collection_modifyitems(
         start, end = stage_filter
         filtered_items = []
         for item in items:
-            stage = _get_stage_from_item(item)
+            stage = item.stash[_STAGE_KEY]
             # Include items without stage marker (infrastructure tests)
             # or items within the filter range
             if stage is None or (start <= stage <= end):
@@ -512,7 +487,14 @@ def pytest_collection_modifyitems(
         # Modify items in place
         items[:] = filtered_items
 
+    # Stages depend on each other's on-disk state, so they must not be split
+    # across xdist workers. One shared group keeps the whole pipeline together.
+    for item in items:
+        if item.stash[_STAGE_KEY] is not None:
+            item.add_marker(pytest.mark.xdist_group(_E2E_XDIST_GROUP))
 
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item: pytest.Item) -> None:
     """Skip tests in stages that depend on failed earlier stages.
 
@@ -520,6 +502,10 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
     be skipped based on prior stage failures. If an earlier stage has failed,
     all subsequent stages are automatically skipped.
 
+    It runs ``tryfirst`` so that the skip is raised before pytest's own
+    setup hook resolves fixtures; skipped tests therefore pay no fixture
+    setup or teardown cost.
+
     Args:
         item: The pytest test item about to be executed.
 
@@ -529,7 +515,7 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
 
     Stage Skipping Behavior:
         This function implements the cascade skip pattern for dependent stages.
-        When StageTracker.should_skip() returns True (meaning an earlier stage
+        When should_skip() returns True (meaning an earlier stage
         has failed), pytest.skip() is called with a message in the format:
 
             "Stage {N} skipped due to stage {M} failure"
@@ -542,39 +528,16 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
 
         1. Extract stage number from test item's @pytest.mark.stage(N) marker
         2. If no stage marker exists, allow test to run (return early)
-        3. Query StageTracker.should_skip(stage) to check for prior failures
+        3. Query should_skip(stage) to check for prior failures
         4. If should_skip returns True, call pytest.skip() with descriptive message
 
-        Example scenario demonstrating the skip cascade:
-
-        >>> tracker = StageTracker.get_instance()
-        >>> tracker.reset()  # Clean state for example
-
-        Stage 1 runs and passes:
-        >>> tracker.mark_passed(1)
-        >>> tracker.should_skip(2)  # Stage 2 can run
-        False
-
-        Stage 2 runs and fails:
-        >>> tracker.mark_failed(2)
-        >>> tracker.first_failure
-        2
-
-        All subsequent stages (3, 4, 5, 6) will be skipped:
-        >>> tracker.should_skip(3)  # Stage 3 should skip
-        True
-        >>> tracker.should_skip(4)  # Stage 4 should skip
-        True
-        >>> tracker.should_skip(5)  # Stage 5 should skip
-        True
-        >>> tracker.should_skip(6)  # Stage 6 should skip
-        True
-
-        Earlier stages are not affected (they already ran):
-        >>> tracker.should_skip(1)  # Stage 1 already ran, not skipped
-        False
-        >>> tracker.should_skip(2)  # Stage 2 already ran, not skipped
-        False
+        Example scenario demonstrating the skip cascade: stage 1 passes
+        (``stage_tracker.mark_passed(1)``), so ``should_skip(2)`` is False
+        and stage 2 runs. Stage 2 fails (``stage_tracker.mark_failed(2)``),
+        which records it as ``get_first_failure()``. From then on
+        ``should_skip()`` is True for stages 3 to 6 and stays False for
+        stages 1 and 2, which have already run. The cascade itself is
+        covered by tests/e2e/test_stage_tracker.py.
 
     Skip Message Format:
         When a stage is skipped, the message provides context for debugging:
@@ -585,53 +548,64 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
         This message is visible in pytest output with -v flag and helps
         identify which stage caused the cascade failure.
     """
-    stage = _get_stage_from_item(item)
+    stage = item.stash.get(_STAGE_KEY, None)
     if stage is None:
         # No stage marker, don't apply stage-based skipping
         return
 
-    tracker = StageTracker.get_instance()
-    if tracker.should_skip(stage):
+    if stage_tracker.should_skip(stage):
         pytest.skip(
-            f"Stage {stage} skipped due to stage {tracker.first_failure} failure"
+            f"Stage {stage} skipped due to stage "
+            f"{stage_tracker.get_first_failure()} failure"
         )
 
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(
-    item: pytest.Item, call: pytest.CallInfo
-) -> Generator[None, pytest.TestReport, None]:
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
     """Track test pass/fail status for stage dependency management.
 
-    This hook runs after each test phase (setup, call, teardown) and updates
-    the StageTracker singleton with the test result. Only the "call" phase
-    (actual test execution) is tracked.
+    This hook receives the finished report of each test phase (setup, call,
+    teardown) and updates the stage tracker with the test result. Only the
+    "call" phase (actual test execution) is tracked. Reports carry no item,
+    so the stage is looked up by node id in the map built at collection.
 
     Args:
-        item: The pytest test item that was executed.
-        call: Information about the test call phase.
-
-    Yields:
-        None: Yields to get the report from the next hook in the chain.
+        report: The test report for the finished phase.
     """
-    outcome = yield
-    report = outcome.get_result()
-
     # Only process the "call" phase (actual test execution)
     # Skip "setup" and "teardown" phases
     if report.when != "call":
         return
 
-    stage = _get_stage_from_item(item)
+    stage = _stage_by_nodeid.get(report.nodeid)
     if stage is None:
         # No stage marker, don't track
         return
 
-    tracker = StageTracker.get_instance()
     if report.passed:
-        tracker.mark_passed(stage)
+        stage_tracker.mark_passed(stage)
     elif report.failed:
-        tracker.mark_failed(stage)
+        stage_tracker.mark_failed(stage)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Release the shared xdist stage state at the end of the session.
+
+    Workers unmap the shared state file. The controller process (or a
+    plain, non-xdist run) then removes the state files left in the cache
+    directory, since by then every worker of the run has finished.
+
+    Args:
+        session: The pytest session object.
+        exitstatus: The exit status pytest will return.
+    """
+    stage_tracker.detach()
+
+    config = session.config
+    cache = getattr(config, "cache", None)
+    if getattr(config, "workerinput", None) is not None or cache is None:
+        return
+    for state_file in cache.mkdir(_CACHE_DIR_NAME).glob(_STATE_FILE_GLOB):
+        state_file.unlink(missing_ok=True)
 
 
 # =============================================================================
@@ -640,15 +614,15 @@ def pytest_runtest_makereport(
 
 
 @pytest.fixture(scope="session")
-def e2e_config(request: pytest.FixtureRequest) -> E2EConfig:
-    """Parse CLI options and return E2E configuration.
+def e2e_config(pytestconfig: pytest.Config) -> E2EConfig:
+    """Return the E2E configuration parsed from CLI options.
 
-    This session-scoped fixture parses the pytest command-line options
-    and constructs an E2EConfig instance that can be used throughout
-    the test session.
+    This session-scoped fixture exposes the E2EConfig built once in
+    pytest_configure, so the command-line options are parsed and validated
+    a single time per session.
 
     Args:
-        request: Pytest fixture request object providing access to config.
+        pytestconfig: The pytest configuration object holding the stash.
 
     Returns:
         E2EConfig instance with parsed stage filter, debug mode, and
@@ -662,21 +636,11 @@ def e2e_config(request: pytest.FixtureRequest) -> E2EConfig:
         ...         # Run stage 3 logic
         ...         pass
     """
-    stage_str = request.config.getoption("--stage", default=None)
-    stage_filter = _parse_stage_filter(stage_str)
-
-    debug = request.config.getoption("--e2e-debug", default=False)
-    timeout_override = request.config.getoption("--timeout-all", default=None)
-
-    return E2EConfig(
-        stage_filter=stage_filter,
-        debug=debug,
-        timeout_override=timeout_override,
-    )
+    return pytestconfig.stash[_E2E_CONFIG_KEY]
 
 
 @pytest.fixture(scope="session")
-def test_project(request: pytest.FixtureRequest) -> E2EProject:
+def test_project(request: pytest.FixtureRequest) -> "E2EProject":
     """Create and set up an E2EProject for the test session.
 
     This session-scoped fixture creates an isolated test project directory
@@ -684,9 +648,15 @@ def test_project(request: pytest.FixtureRequest) -> E2EProject:
     The project persists for the entire test session and is not cleaned up
     automatically (for debugging purposes).
 
+    Under pytest-xdist each worker gets its own project and log directory,
+    suffixed with the worker id, so parallel workers never share state.
+
+    The bootstrapped project (fixture copy plus initial git commit) is
+    cached in the pytest cache directory and reused by later sessions
+    for as long as the fixture files are unchanged.
+
     Args:
-        request: Pytest fixture request object (unused but required for
-            session-scoped fixtures that may need config access).
+        request: Pytest fixture request object providing access to config.
 
     Returns:
         E2EProject instance with setup() already called, ready for use
@@ -702,22 +672,59 @@ def test_project(request: pytest.FixtureRequest) -> E2EProject:
     # Detect tests root directory (tests/e2e/conftest.py -> tests/)
     tests_root = Path(__file__).parent.parent
 
+    from .helpers import E2EProject
+
     # Create the E2EProject instance
-    project = E2EProject("todo-app", tests_root)
+    project = E2EProject(
+        "todo-app", tests_root, worker_id=_get_worker_id(request.config)
+    )
 
     # Set up the project (creates directories, copies fixtures, inits git)
-    project.setup()
+    project.setup(template_dir=_get_template_dir(request.config, project))
 
     return project
 
 
+def _get_template_dir(
+    config: pytest.Config, project: "E2EProject"
+) -> Path | None:
+    """Return the cached bootstrap template directory for a project.
+
+    The directory name embeds the project's bootstrap hash, so editing
+    the fixture or the plugin directories switches to a new template.
+    Templates for an outdated hash are removed the first time the hash
+    change is noticed.
+
+    Args:
+        config: The pytest configuration object.
+        project: The project about to be set up.
+
+    Returns:
+        Template directory path (which may not exist yet), or None when
+        the cache plugin is disabled.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return None
+
+    bootstrap_hash = project.bootstrap_hash()
+    cache_key = f"e2e/bootstrap_hash/{project.project_name}"
+    cache_dir = cache.mkdir(_CACHE_DIR_NAME)
+    if cache.get(cache_key, None) != bootstrap_hash:
+        for stale in cache_dir.glob(f"template-{project.project_name}-*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        cache.set(cache_key, bootstrap_hash)
+
+    return cache_dir / f"template-{project.project_name}-{bootstrap_hash}"
+
+
 # =============================================================================
 # Function-Scoped Fixtures
 # =============================================================================
 
 
 @pytest.fixture
-def project_path(test_project: E2EProject) -> Path:
+def project_path(test_project: "E2EProject") -> Path:
     """Provide the project path for test functions.
 
     This function-scoped fixture extracts the project path from the
@@ -737,15 +744,24 @@ def project_path(test_project: E2EProject) -> Path:
     return test_project.project_path
 
 
-@pytest.fixture
-def claude_runner(test_project: E2EProject, e2e_config: E2EConfig) -> ClaudeRunner:
+@pytest.fixture(scope="session")
+def claude_runner(
+    request: pytest.FixtureRequest,
+    test_project: "E2EProject",
+    e2e_config: E2EConfig,
+) -> "ClaudeRunner":
     """Create a ClaudeRunner configured for the test project.
 
-    This function-scoped fixture creates a ClaudeRunner instance configured
+    This session-scoped fixture creates a ClaudeRunner instance configured
     with the test project's working directory and log directory, along with
-    debug and timeout settings from the E2E configuration.
+    debug and timeout settings from the E2E configuration. The runner keeps
+    no per-test state, so one instance is shared by all tests.
+
+    With --e2e-cached, a CachedClaudeRunner backed by the pytest cache
+    directory is returned instead.
 
     Args:
+        request: Pytest fixture request object providing access to config.
         test_project: The session-scoped E2EProject fixture.
         e2e_config: The session-scoped E2EConfig fixture.
 
@@ -761,6 +777,19 @@ def claude_runner(test_project: E2EProject, e2e_config: E2EConfig) -> ClaudeRunn
         ...     )
         ...     assert result.success
     """
+    from .helpers import CachedClaudeRunner, ClaudeRunner
+
+    cache = getattr(request.config, "cache", None)
+    if e2e_config.cached and cache is not None:
+        return CachedClaudeRunner(
+            work_dir=test_project.project_path,
+            log_dir=test_project.log_dir,
+            cache_dir=cache.mkdir(_CACHE_DIR_NAME) / "claude",
+            debug=e2e_config.debug,
+            timeout_override=e2e_config.timeout_override,
+            plugin_dir=test_project.plugin_dir,
+        )
+
     return ClaudeRunner(
         work_dir=test_project.project_path,
         log_dir=test_project.log_dir,
@@ -770,11 +799,11 @@ def claude_runner(test_project: E2EProject, e2e_config: E2EConfig) -> ClaudeRunn
     )
 
 
-@pytest.fixture
-def file_verifier(test_project: E2EProject) -> FileVerifier:
+@pytest.fixture(scope="session")
+def file_verifier(test_project: "E2EProject") -> "FileVerifier":
     """Create a FileVerifier for the test project.
 
-    This function-scoped fixture creates a FileVerifier instance configured
+    This session-scoped fixture creates a FileVerifier instance configured
     with the test project's base path for verifying file existence and content.
 
     Args:
@@ -788,14 +817,16 @@ def file_verifier(test_project: E2EProject) -> FileVerifier:
         ...     file_verifier.assert_exists("README.md", "Project readme")
         ...     file_verifier.assert_contains("config.py", r"DEBUG", "Debug setting")
     """
+    from .helpers import FileVerifier
+
     return FileVerifier(base_path=test_project.project_path)
 
 
-@pytest.fixture
-def git_verifier(test_project: E2EProject) -> GitVerifier:
+@pytest.fixture(scope="session")
+def git_verifier(test_project: "E2EProject") -> "GitVerifier":
     """Create a GitVerifier for the test project.
 
-    This function-scoped fixture creates a GitVerifier instance configured
+    This session-scoped fixture creates a GitVerifier instance configured
     with the test project's repository path for verifying git state.
 
     Args:
@@ -809,4 +840,120 @@ def git_verifier(test_project: E2EProject) -> GitVerifier:
         ...     git_verifier.assert_is_repo()
         ...     git_verifier.assert_branch_matches(r"main", "main branch")
     """
+    from .helpers import GitVerifier
+
     return GitVerifier(repo_path=test_project.project_path)
+
+
+# Worktree created by /spectra:specify, e.g. worktrees/001-todo-app
+_FEATURE_WORKTREE_PATTERN = r"worktrees/\d+-.*"
+
+
+@pytest.fixture(scope="class")
+def feature_worktree(git_verifier: "GitVerifier") -> Path | None:
+    """Return the feature worktree created by /spectra:specify.
+
+    This class-scoped fixture looks the worktree up once per stage class.
+    It is only requested once the worktree should exist: after the Claude
+    run in stage 3, and from stage 4 on, where no command creates or
+    removes worktrees.
+
+    Args:
+        git_verifier: The session-scoped GitVerifier fixture.
+
+    Returns:
+        Path to the first worktree matching ``worktrees/<number>-<name>``,
+        or None if there is none. Tests assert on it with their own message.
+
+    Example:
+        >>> def test_example(feature_worktree):
+        ...     assert feature_worktree is not None
+    """
+    # Class-scoped fixtures are set up before the per-test git refresh
+    git_verifier.refresh()
+    return git_verifier.get_worktree_path(pattern=_FEATURE_WORKTREE_PATTERN)
+
+
+def _find_feature_artifact(
+    file_verifier: "FileVerifier", feature_worktree: Path | None, name: str
+) -> Path | None:
+    """Find a feature artifact such as plan.md in the feature worktree.
+
+    Args:
+        file_verifier: The session-scoped FileVerifier fixture.
+        feature_worktree: The feature worktree, or None if it is missing.
+        name: File name of the artifact.
+
+    Returns:
+        Path to ``specs/<number>-<name>/<name>`` in the worktree, or None.
+    """
+    if feature_worktree is None:
+        return None
+    return file_verifier.find_file(
+        pattern=rf"specs/\d+-.*/{re.escape(name)}",
+        base_path=feature_worktree,
+    )
+
+
+@pytest.fixture(scope="class")
+def spec_file(
+    file_verifier: "FileVerifier", feature_worktree: Path | None
+) -> Path | None:
+    """Return the feature's spec.md, looked up once per stage class.
+
+    Args:
+        file_verifier: The session-scoped FileVerifier fixture.
+        feature_worktree: The class-scoped feature worktree fixture.
+
+    Returns:
+        Path to spec.md in the feature worktree, or None if not found.
+    """
+    return _find_feature_artifact(file_verifier, feature_worktree, "spec.md")
+
+
+@pytest.fixture(scope="class")
+def plan_file(
+    file_verifier: "FileVerifier", feature_worktree: Path | None
+) -> Path | None:
+    """Return the feature's plan.md, looked up once per stage class.
+
+    Args:
+        file_verifier: The session-scoped FileVerifier fixture.
+        feature_worktree: The class-scoped feature worktree fixture.
+
+    Returns:
+        Path to plan.md in the feature worktree, or None if not found.
+    """
+    return _find_feature_artifact(file_verifier, feature_worktree, "plan.md")
+
+
+@pytest.fixture(scope="class")
+def tasks_file(
+    file_verifier: "FileVerifier", feature_worktree: Path | None
+) -> Path | None:
+    """Return the feature's tasks.md, looked up once per stage class.
+
+    Args:
+        file_verifier: The session-scoped FileVerifier fixture.
+        feature_worktree: The class-scoped feature worktree fixture.
+
+    Returns:
+        Path to tasks.md in the feature worktree, or None if not found.
+    """
+    return _find_feature_artifact(file_verifier, feature_worktree, "tasks.md")
+
+
+@pytest.fixture(autouse=True)
+def _refresh_git_state(request: pytest.FixtureRequest) -> None:
+    """Drop the GitVerifier's cached repository state before each test.
+
+    The session-scoped GitVerifier caches what it reads from git, while
+    Claude runs in earlier tests change the repository. Only tests that
+    already use git_verifier are affected, so no project is set up for
+    the others.
+
+    Args:
+        request: Pytest fixture request object for the current test.
+    """
+    if "git_verifier" in request.fixturenames:
+        request.getfixturevalue("git_verifier").refresh()
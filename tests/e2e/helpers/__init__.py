@@ -2,17 +2,67 @@
 
 This package contains shared utilities, fixtures, and helper functions
 used across E2E test modules.
+
+The helper classes are imported lazily on first attribute access (PEP 562),
+so importing one submodule (e.g. ``helpers.stage_tracker`` from conftest)
+doesn't load the subprocess and git machinery of the others.
 """
 
-from .claude_runner import ClaudeResult, ClaudeRunner
-from .file_verifier import FileVerifier
-from .git_verifier import GitVerifier
-from .test_environment import E2EProject
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .claude_runner import CachedClaudeRunner, ClaudeResult, ClaudeRunner
+    from .file_verifier import FileVerifier
+    from .git_verifier import GitVerifier
+    from .stage_tracker import StageStatus, StageTracker
+    from .test_environment import E2EProject
+
+# Public name -> submodule defining it.
+_LAZY_IMPORTS = {
+    "CachedClaudeRunner": ".claude_runner",
+    "ClaudeResult": ".claude_runner",
+    "ClaudeRunner": ".claude_runner",
+    "E2EProject": ".test_environment",
+    "FileVerifier": ".file_verifier",
+    "GitVerifier": ".git_verifier",
+    "StageStatus": ".stage_tracker",
+    "StageTracker": ".stage_tracker",
+}
 
 __all__ = [
+    "CachedClaudeRunner",
     "ClaudeResult",
     "ClaudeRunner",
     "E2EProject",
     "FileVerifier",
     "GitVerifier",
+    "StageStatus",
+    "StageTracker",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a public helper class on first access.
+
+    Args:
+        name: Attribute name being looked up on the package.
+
+    Returns:
+        The requested helper class.
+
+    Raises:
+        AttributeError: If name is not a public helper.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including not yet imported helpers."""
+    return sorted(set(globals()) | set(__all__))
@@ -4,14 +4,27 @@ This module provides utilities for executing Claude CLI commands and
 capturing their results in a structured format.
 """
 
+import codecs
+import hashlib
+import itertools
+import json
+import os
+import re
+import selectors
+import shutil
+import signal
 import subprocess
 import sys
+import tarfile
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClaudeResult:
     """Immutable data class containing execution results from a Claude CLI command.
 
@@ -25,6 +38,7 @@ class ClaudeResult:
         timed_out: True if command exceeded the configured timeout.
         duration: Execution time in seconds (must be >= 0).
         exit_code: Process exit code (0 indicates success).
+        log_file: Path of the log file written for the run, if any.
 
     Raises:
         ValueError: If validation rules are violated:
@@ -51,27 +65,33 @@ class ClaudeResult:
     timed_out: bool
     duration: float
     exit_code: int
+    log_file: Path | None = None
 
     def __post_init__(self) -> None:
         """Validate the ClaudeResult fields after initialization.
 
+        Valid results pass a single combined check; the specific error
+        message is only worked out when validation fails.
+
         Raises:
             ValueError: If any validation rule is violated.
         """
-        if self.success and self.exit_code != 0:
-            raise ValueError(
-                f"success=True requires exit_code=0, got exit_code={self.exit_code}"
-            )
+        if self.duration < 0 or (
+            self.success and (self.exit_code != 0 or self.timed_out)
+        ):
+            raise ValueError(self._diagnose())
 
-        if self.success and self.timed_out:
-            raise ValueError(
-                "success=True is incompatible with timed_out=True"
-            )
+    def _diagnose(self) -> str:
+        """Describe the first validation rule this result violates.
 
-        if self.duration < 0:
-            raise ValueError(
-                f"duration must be >= 0, got {self.duration}"
-            )
+        Returns:
+            The error message for the violated rule.
+        """
+        if self.success and self.exit_code != 0:
+            return f"success=True requires exit_code=0, got exit_code={self.exit_code}"
+        if self.success and self.timed_out:
+            return "success=True is incompatible with timed_out=True"
+        return f"duration must be >= 0, got {self.duration}"
 
 
 class ClaudeRunner:
@@ -86,6 +106,12 @@ class ClaudeRunner:
         log_dir: Directory for log file output.
         debug: Enable streaming output to terminal.
         timeout_override: Override default timeouts (optional).
+        unique_logs: Suffix each log name with a process-wide run number.
+
+    Concurrent run() calls on one runner are safe as long as their prompts
+    do not write to the same files under work_dir; set unique_logs so that
+    runs sharing a log_name do not overwrite each other's log. run_many()
+    submits such independent runs to a thread pool.
 
     Constants:
         DEFAULT_TIMEOUT_INIT: Timeout for initialization stage (120s).
@@ -94,8 +120,12 @@ class ClaudeRunner:
         DEFAULT_TIMEOUT_PLAN: Timeout for planning stage (600s).
         DEFAULT_TIMEOUT_TASKS: Timeout for tasks stage (600s).
         DEFAULT_TIMEOUT_IMPLEMENT: Timeout for implementation stage (1800s).
+        KILL_GRACE_PERIOD: Seconds between SIGTERM and SIGKILL when a timed
+            out run's process group is stopped (2s).
+        OUTPUT_TAIL_BYTES: Bytes of stdout and stderr each kept in the
+            ClaudeResult; longer output is only complete in the log (4 MiB).
         MODEL: Claude model to use for execution.
-        ALLOWED_TOOLS: List of tools allowed for Claude CLI execution.
+        ALLOWED_TOOLS: Tuple of tools allowed for Claude CLI execution.
 
     Example:
         >>> runner = ClaudeRunner(work_dir=Path("/tmp"), log_dir=Path("/logs"))
@@ -111,12 +141,30 @@ class ClaudeRunner:
     DEFAULT_TIMEOUT_PLAN = 600
     DEFAULT_TIMEOUT_TASKS = 600
     DEFAULT_TIMEOUT_IMPLEMENT = 3600
+    # Stage timeouts indexed by stage - 1
+    _STAGE_TIMEOUTS = (
+        DEFAULT_TIMEOUT_INIT,
+        DEFAULT_TIMEOUT_CONSTITUTION,
+        DEFAULT_TIMEOUT_SPECIFY,
+        DEFAULT_TIMEOUT_PLAN,
+        DEFAULT_TIMEOUT_TASKS,
+        DEFAULT_TIMEOUT_IMPLEMENT,
+    )
+
+    # Seconds a timed-out process group gets to exit after SIGTERM
+    KILL_GRACE_PERIOD = 2
+
+    # Bytes of each output stream kept in ClaudeResult; the log has it all
+    OUTPUT_TAIL_BYTES = 4 << 20
+
+    # Shared run numbers for unique log names; next() is atomic under the GIL
+    _RUN_SEQ = itertools.count(1)
 
     # Claude model configuration
     MODEL = "claude-sonnet-4-5@20250929"
 
     # Allowed tools for CLI execution
-    ALLOWED_TOOLS = [
+    ALLOWED_TOOLS = (
         "Bash",
         "Read",
         "Write",
@@ -129,7 +177,16 @@ class ClaudeRunner:
         "WebSearch",
         "NotebookEdit",
         "Skill",
-    ]
+    )
+    # Joined once for the --allowedTools argument
+    _ALLOWED_TOOLS_ARG = ",".join(ALLOWED_TOOLS)
+
+    # Output fragments that indicate the CLI is not authenticated
+    _AUTH_ERROR_RE = re.compile(
+        r"not authenticated|authentication required|please log in|api key"
+        r"|unauthorized",
+        re.IGNORECASE,
+    )
 
     def __init__(
         self,
@@ -138,6 +195,7 @@ class ClaudeRunner:
         debug: bool = False,
         timeout_override: int | None = None,
         plugin_dir: Path | None = None,
+        unique_logs: bool = False,
     ) -> None:
         """Initialize the ClaudeRunner.
 
@@ -147,12 +205,17 @@ class ClaudeRunner:
             debug: Enable streaming output to terminal. Defaults to False.
             timeout_override: Override default timeouts. Defaults to None.
             plugin_dir: Path to plugin directory to load. Defaults to None.
+            unique_logs: Append "_<n>" to every log name so concurrent or
+                repeated runs never share a log file. Defaults to False.
         """
         self.work_dir = work_dir
         self.log_dir = log_dir
         self.debug = debug
         self.timeout_override = timeout_override
         self.plugin_dir = plugin_dir
+        self.unique_logs = unique_logs
+        # Resolved once; None if the CLI is not on PATH (reported by run())
+        self._claude_exe = shutil.which("claude")
 
     def get_stage_timeout(self, stage: int) -> int:
         """Get the timeout for a specific stage.
@@ -175,19 +238,158 @@ class ClaudeRunner:
         if self.timeout_override is not None:
             return self.timeout_override
 
-        stage_timeouts = {
-            1: self.DEFAULT_TIMEOUT_INIT,
-            2: self.DEFAULT_TIMEOUT_CONSTITUTION,
-            3: self.DEFAULT_TIMEOUT_SPECIFY,
-            4: self.DEFAULT_TIMEOUT_PLAN,
-            5: self.DEFAULT_TIMEOUT_TASKS,
-            6: self.DEFAULT_TIMEOUT_IMPLEMENT,
+        if not 1 <= stage <= 6:
+            raise ValueError(f"Invalid stage {stage}. Must be between 1 and 6.")
+
+        return self._STAGE_TIMEOUTS[stage - 1]
+
+    def _log_file(self, log_name: str) -> Path:
+        """Get the log file path for a run.
+
+        Args:
+            log_name: Base name for the log file (without extension).
+
+        Returns:
+            Path of the log file, numbered if unique_logs is set.
+        """
+        if self.unique_logs:
+            log_name = f"{log_name}_{next(self._RUN_SEQ)}"
+        return self.log_dir / f"{log_name}.log"
+
+    def _stream_output(
+        self,
+        process: subprocess.Popen,
+        start_time: float,
+        timeout: int,
+        out_spool: "IO[bytes]",
+        err_spool: "IO[bytes]",
+    ) -> bool:
+        """Mirror a running process's output to the terminal while capturing it.
+
+        Both pipes are switched to non-blocking mode and watched with a
+        selector, so whichever stream has data is drained as soon as it
+        arrives. A full stderr pipe can therefore never stall the process,
+        and the single select() call doubles as the idle wait and the
+        timeout check instead of a polling loop. Captured bytes go straight
+        to the spool files, so memory use does not grow with the output.
+
+        Args:
+            process: Process started with stdout and stderr as binary pipes.
+            start_time: time.time() value when the run started.
+            timeout: Timeout in seconds, measured from start_time.
+            out_spool: Binary file receiving a copy of stdout.
+            err_spool: Binary file receiving a copy of stderr.
+
+        Returns:
+            True if the run timed out. The process has exited (or been
+            killed) when this returns.
+        """
+        mirrors = {process.stdout: sys.stdout, process.stderr: sys.stderr}
+        spools = {process.stdout: out_spool, process.stderr: err_spool}
+        decoders = {
+            stream: codecs.getincrementaldecoder("utf-8")("replace")
+            for stream in mirrors
         }
+        timed_out = False
 
-        if stage not in stage_timeouts:
-            raise ValueError(f"Invalid stage {stage}. Must be between 1 and 6.")
+        with selectors.DefaultSelector() as selector:
+            for stream in mirrors:
+                os.set_blocking(stream.fileno(), False)
+                selector.register(stream, selectors.EVENT_READ)
+
+            # Read until both pipes reach EOF or the timeout expires
+            while selector.get_map():
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                for key, _ in selector.select(timeout=remaining):
+                    stream = key.fileobj
+                    try:
+                        data = os.read(stream.fileno(), 65536)
+                    except BlockingIOError:
+                        continue
+                    if not data:
+                        selector.unregister(stream)
+                        continue
+                    spools[stream].write(data)
+                    mirror = mirrors[stream]
+                    mirror.write(decoders[stream].decode(data))
+                    mirror.flush()
+
+        if not timed_out:
+            # Pipes are closed; the process may still be shutting down
+            try:
+                process.wait(timeout=max(timeout - (time.time() - start_time), 0))
+            except subprocess.TimeoutExpired:
+                timed_out = True
+        if timed_out:
+            self._kill_process_group(process)
+        for stream in mirrors:
+            stream.close()
+
+        return timed_out
+
+    def _open_spool(self) -> "IO[bytes]":
+        """Open an anonymous temporary file to collect one output stream.
 
-        return stage_timeouts[stage]
+        Spools are created in log_dir, so large outputs land on the same
+        disk as the logs they are copied into, falling back to the system
+        temporary directory.
+
+        Returns:
+            A binary temporary file, deleted when closed.
+        """
+        try:
+            return tempfile.TemporaryFile(dir=self.log_dir)
+        except OSError:
+            return tempfile.TemporaryFile()
+
+    def _read_tail(self, spool: "IO[bytes]", log_file: Path) -> str:
+        """Read the end of a spooled output stream for the ClaudeResult.
+
+        Args:
+            spool: Spool file holding the stream.
+            log_file: Log file holding the full output, named in the
+                truncation note.
+
+        Returns:
+            The decoded stream, limited to its last OUTPUT_TAIL_BYTES bytes.
+        """
+        size = spool.seek(0, os.SEEK_END)
+        skipped = max(size - self.OUTPUT_TAIL_BYTES, 0)
+        spool.seek(skipped)
+        text = spool.read().decode("utf-8", errors="replace")
+        if skipped:
+            text = f"[{skipped} earlier bytes omitted, see {log_file}]\n{text}"
+        return text
+
+    def _kill_process_group(self, process: subprocess.Popen) -> None:
+        """Stop a timed-out process together with everything it spawned.
+
+        The process must have been started with ``start_new_session=True``,
+        which makes it the leader of its own process group. The group first
+        gets SIGTERM and KILL_GRACE_PERIOD seconds to exit; SIGKILL then
+        removes the leader if needed, and any children (node workers, tool
+        shells) that outlived it.
+
+        Args:
+            process: The process group leader to stop.
+        """
+        pgid = process.pid
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        try:
+            process.wait(timeout=self.KILL_GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            pass
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        process.wait()
 
     def run(self, prompt: str, stage: int, log_name: str) -> ClaudeResult:
         """Execute a Claude CLI command with the given prompt.
@@ -210,18 +412,15 @@ class ClaudeRunner:
             >>> result = runner.run("Hello", stage=1, log_name="hello_test")
             >>> print(result.stdout)
         """
-        # Build the allowed tools argument
-        tools_arg = ",".join(self.ALLOWED_TOOLS)
-
         # Build the command
         cmd = [
-            "claude",
+            self._claude_exe or "claude",
             "-p",
             prompt,
             "--model",
             self.MODEL,
             "--allowedTools",
-            tools_arg,
+            self._ALLOWED_TOOLS_ARG,
         ]
 
         # Add plugin directory if configured
@@ -232,152 +431,114 @@ class ClaudeRunner:
         timeout = self.get_stage_timeout(stage)
 
         # Prepare log file path
-        log_file = self.log_dir / f"{log_name}.log"
+        log_file = self._log_file(log_name)
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # Reported when the log write fails below
 
         # Track execution time
         start_time = time.time()
         timed_out = False
-        stdout = ""
-        stderr = ""
+        error = ""
         exit_code = -1
 
-        try:
-            if self.debug:
-                # Stream output to terminal while also capturing
+        # Output is spooled to disk as it arrives, not buffered in memory
+        with self._open_spool() as out_spool, self._open_spool() as err_spool:
+            try:
+                if self._claude_exe is None:
+                    # Fail fast, without forking, through the handler below
+                    raise FileNotFoundError("claude")
+
+                # The CLI runs in its own session so a timeout can stop the
+                # whole process group
                 process = subprocess.Popen(
                     cmd,
                     cwd=self.work_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
+                    stdout=subprocess.PIPE if self.debug else out_spool,
+                    stderr=subprocess.PIPE if self.debug else err_spool,
+                    start_new_session=True,
                 )
-
-                stdout_lines = []
-                stderr_lines = []
-
-                # Read stdout in real-time
-                while True:
-                    # Check if process has finished
-                    return_code = process.poll()
-
-                    # Read available output
-                    if process.stdout:
-                        line = process.stdout.readline()
-                        if line:
-                            stdout_lines.append(line)
-                            sys.stdout.write(line)
-                            sys.stdout.flush()
-
-                    if return_code is not None:
-                        # Process finished, read remaining output
-                        if process.stdout:
-                            remaining = process.stdout.read()
-                            if remaining:
-                                stdout_lines.append(remaining)
-                                sys.stdout.write(remaining)
-                                sys.stdout.flush()
-                        if process.stderr:
-                            stderr_content = process.stderr.read()
-                            if stderr_content:
-                                stderr_lines.append(stderr_content)
-                                sys.stderr.write(stderr_content)
-                                sys.stderr.flush()
-                        break
-
-                    # Check timeout
-                    elapsed = time.time() - start_time
-                    if elapsed > timeout:
-                        process.kill()
-                        process.wait()
-                        timed_out = True
-                        break
-
-                stdout = "".join(stdout_lines)
-                stderr = "".join(stderr_lines)
-                exit_code = process.returncode if process.returncode is not None else -1
-
-            else:
-                # Non-streaming execution
-                result = subprocess.run(
-                    cmd,
-                    cwd=self.work_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
+                try:
+                    if self.debug:
+                        # Stream output to terminal while also capturing
+                        timed_out = self._stream_output(
+                            process, start_time, timeout, out_spool, err_spool
+                        )
+                    else:
+                        # The CLI writes straight into the spools; just wait
+                        try:
+                            process.wait(timeout=timeout)
+                        except subprocess.TimeoutExpired:
+                            timed_out = True
+                            self._kill_process_group(process)
+                except BaseException:
+                    # Ctrl-C or any other error must not leave the CLI and
+                    # its children running in their own session
+                    self._kill_process_group(process)
+                    raise
+                if not timed_out:
+                    exit_code = process.returncode
+
+            except FileNotFoundError:
+                error = (
+                    "Claude CLI not found. Please ensure the 'claude' command is installed "
+                    "and available in your PATH. Install it with: npm install -g @anthropic-ai/claude-cli"
                 )
-                stdout = result.stdout
-                stderr = result.stderr
-                exit_code = result.returncode
-
-        except subprocess.TimeoutExpired as e:
-            timed_out = True
-            # e.stdout/stderr can be str or bytes depending on text= flag
-            if e.stdout is not None:
-                stdout = e.stdout if isinstance(e.stdout, str) else e.stdout.decode("utf-8", errors="replace")
-            if e.stderr is not None:
-                stderr = e.stderr if isinstance(e.stderr, str) else e.stderr.decode("utf-8", errors="replace")
-            # Add timeout error message
-            stderr = (
-                f"Command timed out after {timeout} seconds (stage {stage}). "
-                f"Consider increasing the timeout with --timeout-all option.\n\n"
-                f"Original stderr:\n{stderr}"
-            )
-            exit_code = -1
 
-        except FileNotFoundError:
-            stderr = (
-                "Claude CLI not found. Please ensure the 'claude' command is installed "
-                "and available in your PATH. Install it with: npm install -g @anthropic-ai/claude-cli"
-            )
-            exit_code = -1
-
-        except subprocess.SubprocessError as e:
-            stderr = f"{type(e).__name__}: {e}"
-            exit_code = -1
-
-        finally:
-            duration = time.time() - start_time
-
-            # Write log file
-            try:
-                self.log_dir.mkdir(parents=True, exist_ok=True)
-                with open(log_file, "w") as f:
-                    f.write(f"=== Claude CLI Execution Log ===\n")
-                    f.write(f"Stage: {stage}\n")
-                    f.write(f"Timeout: {timeout}s\n")
-                    f.write(f"Duration: {duration:.2f}s\n")
-                    f.write(f"Timed Out: {timed_out}\n")
-                    f.write(f"Exit Code: {exit_code}\n")
-                    f.write(f"\n=== PROMPT ===\n{prompt}\n")
-                    f.write(f"\n=== STDOUT ===\n{stdout}\n")
-                    f.write(f"\n=== STDERR ===\n{stderr}\n")
-            except OSError as log_error:
-                # Warn about log write failure so users know logs are missing
-                sys.stderr.write(
-                    f"WARNING: Failed to write log file '{log_file}': {log_error}\n"
-                    f"Claude output will not be persisted for debugging.\n"
-                )
+            except subprocess.SubprocessError as e:
+                error = f"{type(e).__name__}: {e}"
+
+            finally:
+                duration = time.time() - start_time
+
+                if timed_out:
+                    # Add timeout error message ahead of the CLI's stderr
+                    error = (
+                        f"Command timed out after {timeout} seconds (stage {stage}). "
+                        f"Consider increasing the timeout with --timeout-all option.\n\n"
+                        f"Original stderr:\n"
+                    )
+
+                # Write log file, copying the spooled output across
+                try:
+                    with open(log_file, "wb") as log:
+                        log.write(
+                            f"=== Claude CLI Execution Log ===\n"
+                            f"Stage: {stage}\n"
+                            f"Timeout: {timeout}s\n"
+                            f"Duration: {duration:.2f}s\n"
+                            f"Timed Out: {timed_out}\n"
+                            f"Exit Code: {exit_code}\n"
+                            f"\n=== PROMPT ===\n{prompt}\n"
+                            f"\n=== STDOUT ===\n".encode("utf-8")
+                        )
+                        out_spool.seek(0)
+                        shutil.copyfileobj(out_spool, log)
+                        log.write(f"\n\n=== STDERR ===\n{error}".encode("utf-8"))
+                        err_spool.seek(0)
+                        shutil.copyfileobj(err_spool, log)
+                        log.write(b"\n")
+                except OSError as log_error:
+                    # Warn about log write failure so users know logs are missing
+                    sys.stderr.write(
+                        f"WARNING: Failed to write log file '{log_file}': {log_error}\n"
+                        f"Claude output will not be persisted for debugging.\n"
+                    )
+
+            stdout = self._read_tail(out_spool, log_file)
+            stderr = error + self._read_tail(err_spool, log_file)
 
         # Determine success
         success = exit_code == 0 and not timed_out
 
         # Check for authentication errors
-        auth_error_patterns = [
-            "not authenticated",
-            "authentication required",
-            "please log in",
-            "API key",
-            "unauthorized",
-        ]
-        combined_output = (stdout + stderr).lower()
-        for pattern in auth_error_patterns:
-            if pattern.lower() in combined_output:
-                stderr = (
-                    f"Claude CLI authentication error detected. {stderr}\n\n"
-                    "Please authenticate with: claude login"
-                )
-                success = False
-                break
+        if self._AUTH_ERROR_RE.search(stdout) or self._AUTH_ERROR_RE.search(stderr):
+            stderr = (
+                f"Claude CLI authentication error detected. {stderr}\n\n"
+                "Please authenticate with: claude login"
+            )
+            success = False
 
         return ClaudeResult(
             success=success,
@@ -386,4 +547,310 @@ class ClaudeRunner:
             timed_out=timed_out,
             duration=duration,
             exit_code=exit_code,
+            log_file=log_file,
         )
+
+    def run_many(
+        self, runs: list[tuple[str, int, str]], max_workers: int | None = None
+    ) -> list[ClaudeResult]:
+        """Execute independent Claude CLI commands concurrently.
+
+        Each run spends its time waiting on its subprocess, so a thread
+        pool overlaps them without contention on the GIL. The prompts must
+        not write to the same files under work_dir.
+
+        Args:
+            runs: (prompt, stage, log_name) tuples, as passed to run().
+            max_workers: Maximum number of concurrent runs. Defaults to one
+                per run.
+
+        Returns:
+            The ClaudeResult of each run, in the order of runs.
+
+        Example:
+            >>> runner = ClaudeRunner(Path("/tmp"), Path("/logs"), unique_logs=True)
+            >>> results = runner.run_many([
+            ...     ("Summarize README.md", 3, "summary"),
+            ...     ("List the TODOs", 3, "todos"),
+            ... ])
+        """
+        if not runs:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or len(runs)) as pool:
+            return list(pool.map(lambda run: self.run(*run), runs))
+
+
+class CachedClaudeRunner(ClaudeRunner):
+    """ClaudeRunner that replays successful runs from an on-disk cache.
+
+    Each run is keyed on the prompt, stage, model, allowed tools, the
+    plugin directory contents and the current state of the working
+    directory (file contents plus git HEAD). On a cache miss the prompt is
+    executed normally and, if it succeeded, the resulting working directory
+    (including ``.git``) is archived next to the captured output. On a hit
+    the archive is unpacked over the working directory instead of calling
+    the Claude CLI, so later stages see exactly the state they would have
+    seen after a real run, and their own keys match the cached ones too.
+
+    Failed runs are never cached, so a failure is always reproduced by a
+    real CLI call. Since keys and replays cover the whole working directory,
+    runs on one CachedClaudeRunner must not overlap; do not use run_many().
+
+    Attributes:
+        cache_dir: Directory holding the cached results and archives.
+
+    Example:
+        >>> runner = CachedClaudeRunner(
+        ...     work_dir=Path("/tmp/project"),
+        ...     log_dir=Path("/logs"),
+        ...     cache_dir=Path(".pytest_cache/d/spectra-e2e/claude"),
+        ... )
+        >>> first = runner.run("Create a hello world", stage=1, log_name="test")
+        >>> again = runner.run("Create a hello world", stage=1, log_name="test")
+        >>> # On a rerun from the same starting state, "again" is replayed
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        log_dir: Path,
+        cache_dir: Path,
+        debug: bool = False,
+        timeout_override: int | None = None,
+        plugin_dir: Path | None = None,
+        unique_logs: bool = False,
+    ) -> None:
+        """Initialize the CachedClaudeRunner.
+
+        Args:
+            work_dir: Working directory for command execution.
+            log_dir: Directory for log file output.
+            cache_dir: Directory holding cached results (created if missing).
+            debug: Enable streaming output to terminal. Defaults to False.
+            timeout_override: Override default timeouts. Defaults to None.
+            plugin_dir: Path to plugin directory to load. Defaults to None.
+            unique_logs: Append "_<n>" to every log name. Defaults to False.
+        """
+        super().__init__(
+            work_dir=work_dir,
+            log_dir=log_dir,
+            debug=debug,
+            timeout_override=timeout_override,
+            plugin_dir=plugin_dir,
+            unique_logs=unique_logs,
+        )
+        self.cache_dir = cache_dir
+
+    def run(self, prompt: str, stage: int, log_name: str) -> ClaudeResult:
+        """Execute a Claude CLI command, or replay it from the cache.
+
+        Args:
+            prompt: The prompt to send to Claude CLI.
+            stage: Stage number (1-6) for timeout determination.
+            log_name: Base name for the log file (without extension).
+
+        Returns:
+            ClaudeResult of the real or replayed execution. Replayed results
+            carry the original output and exit code, and the time spent
+            restoring the working directory as duration.
+        """
+        start_time = time.time()
+        key = self._cache_key(prompt, stage)
+        result_file = self.cache_dir / f"{key}.json"
+        archive_file = self.cache_dir / f"{key}.tar.gz"
+
+        if result_file.is_file() and archive_file.is_file():
+            cached = json.loads(result_file.read_text(encoding="utf-8"))
+            self._restore_work_dir(archive_file, cached.get("work_dir"))
+            result = ClaudeResult(
+                success=True,
+                stdout=cached["stdout"],
+                stderr=cached["stderr"],
+                timed_out=False,
+                duration=time.time() - start_time,
+                exit_code=0,
+                log_file=self._log_file(log_name),
+            )
+            self._write_replay_log(stage, key, prompt, result)
+            return result
+
+        result = super().run(prompt, stage, log_name)
+        if result.success:
+            self._store(key, result)
+        return result
+
+    def _cache_key(self, prompt: str, stage: int) -> str:
+        """Compute the cache key for a prompt in the current project state.
+
+        Args:
+            prompt: The prompt to send to Claude CLI.
+            stage: Stage number of the run.
+
+        Returns:
+            Hex digest identifying the run.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(
+            f"{stage}\0{self.MODEL}\0{self._ALLOWED_TOOLS_ARG}\0".encode()
+        )
+        digest.update(prompt.encode("utf-8"))
+
+        head = subprocess.run(
+            ["git", "rev-parse", "--symbolic-full-name", "HEAD", "HEAD"],
+            cwd=self.work_dir,
+            capture_output=True,
+            text=True,
+        )
+        digest.update(f"\0{head.stdout}".encode())
+
+        _hash_tree(digest, self.work_dir, exclude=".git")
+        if self.plugin_dir is not None:
+            _hash_tree(digest, self.plugin_dir)
+        return digest.hexdigest()
+
+    def _store(self, key: str, result: ClaudeResult) -> None:
+        """Archive the working directory and output of a successful run.
+
+        Both files are written under temporary names and renamed into place,
+        the JSON result last, so a partially written entry is never read.
+
+        Args:
+            key: Cache key of the run.
+            result: Result of the real execution.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+
+        archive_file = self.cache_dir / f"{key}.tar.gz"
+        tmp_archive = archive_file.with_name(archive_file.name + suffix)
+        with tarfile.open(tmp_archive, "w:gz") as tar:
+            for item in self.work_dir.iterdir():
+                tar.add(item, arcname=item.name)
+        os.replace(tmp_archive, archive_file)
+
+        result_file = self.cache_dir / f"{key}.json"
+        tmp_result = result_file.with_name(result_file.name + suffix)
+        tmp_result.write_text(
+            json.dumps(
+                {
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                    "work_dir": str(self.work_dir.resolve()),
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_result, result_file)
+
+    def _restore_work_dir(
+        self, archive_file: Path, source_dir: str | None = None
+    ) -> None:
+        """Replace the working directory contents with a cached archive.
+
+        Args:
+            archive_file: Archive written by _store().
+            source_dir: Resolved working directory the archive was taken
+                from, used to relocate linked worktrees. Defaults to None.
+        """
+        for item in self.work_dir.iterdir():
+            if item.is_dir() and not item.is_symlink():
+                shutil.rmtree(item)
+            else:
+                item.unlink()
+
+        with tarfile.open(archive_file, "r:gz") as tar:
+            # Use the safe extraction filter where this Python provides it
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(self.work_dir, filter="data")
+            else:
+                tar.extractall(self.work_dir)
+
+        if source_dir is not None:
+            self._repair_worktrees(Path(source_dir))
+
+    def _repair_worktrees(self, source_dir: Path) -> None:
+        """Point linked worktrees restored from source_dir at work_dir.
+
+        Git records absolute paths in both directions: .git/worktrees/<id>/gitdir
+        names the worktree's .git file, and that file names the admin
+        directory. After a replay into a different directory both still
+        point into source_dir, so both are rewritten for every worktree that
+        lived inside it. ``git worktree repair`` is not used, since it would
+        follow the stale links and "repair" source_dir if that still exists.
+
+        Args:
+            source_dir: Resolved working directory the archive was taken from.
+        """
+        work_dir = self.work_dir.resolve()
+        admin_root = work_dir / ".git" / "worktrees"
+        if source_dir == work_dir or not admin_root.is_dir():
+            return
+
+        for gitdir_file in sorted(admin_root.glob("*/gitdir")):
+            old_path = Path(gitdir_file.read_text(encoding="utf-8").strip()).parent
+            try:
+                new_path = work_dir / old_path.relative_to(source_dir)
+            except ValueError:
+                continue  # Worktree outside the cached directory
+            if not new_path.is_dir():
+                continue
+            gitdir_file.write_text(f"{new_path / '.git'}\n", encoding="utf-8")
+            (new_path / ".git").write_text(
+                f"gitdir: {gitdir_file.parent}\n", encoding="utf-8"
+            )
+
+    def _write_replay_log(
+        self, stage: int, key: str, prompt: str, result: ClaudeResult
+    ) -> None:
+        """Write the log file for a run replayed from the cache.
+
+        Args:
+            stage: Stage number of the run.
+            key: Cache key the result was replayed from.
+            prompt: The prompt of the run.
+            result: The replayed result, whose log_file is written.
+        """
+        log_file = result.log_file
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            log_file.write_text(
+                f"=== Claude CLI Execution Log (replayed from cache) ===\n"
+                f"Stage: {stage}\n"
+                f"Cache Key: {key}\n"
+                f"Duration: {result.duration:.2f}s\n"
+                f"\n=== PROMPT ===\n{prompt}\n"
+                f"\n=== STDOUT ===\n{result.stdout}\n"
+                f"\n=== STDERR ===\n{result.stderr}\n",
+                encoding="utf-8",
+            )
+        except OSError as log_error:
+            sys.stderr.write(
+                f"WARNING: Failed to write log file '{log_file}': {log_error}\n"
+            )
+
+
+def _hash_tree(
+    digest: "hashlib.blake2b", root: Path, exclude: str | None = None
+) -> None:
+    """Feed the relative paths and contents of all files under root into digest.
+
+    Args:
+        digest: Hash object to update.
+        root: Directory to walk.
+        exclude: Optional entry name to skip at any depth. ".git" covers the
+            repository and the .git files of linked worktrees, which hold
+            absolute paths.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        if exclude is not None and exclude in dirnames:
+            dirnames.remove(exclude)
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename == exclude:
+                continue
+            path = Path(dirpath, filename)
+            digest.update(f"\0{path.relative_to(root).as_posix()}\0".encode())
+            if path.is_symlink():
+                digest.update(os.readlink(path).encode())
+            else:
+                digest.update(path.read_bytes())
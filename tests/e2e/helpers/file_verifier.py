@@ -4,8 +4,190 @@ This module provides utilities for asserting file existence, content patterns,
 and other file-related conditions in a structured format.
 """
 
+import contextlib
+import errno
+import functools
+import mmap
+import os
 import re
+import stat
 from pathlib import Path
+from typing import Iterator
+
+
+# Bytes whose presence makes byte-level regex scanning differ from searching
+# the decoded text: carriage returns (translated by universal newlines),
+# the \x1c-\x1f separators (whitespace to str but not bytes patterns) and
+# any non-ASCII byte (\w, \s, "." and IGNORECASE treat characters, not bytes)
+_NOT_PLAIN_ASCII = re.compile(rb"[\r\x1c-\x1f\x80-\xff]")
+
+
+def _is_plain_ascii(content: "mmap.mmap | bytes") -> bool:
+    """Check whether bytes patterns can scan a file in place of its text.
+
+    Args:
+        content: File contents, as yielded by FileVerifier._map_file.
+
+    Returns:
+        True if the contents contain none of the bytes in _NOT_PLAIN_ASCII.
+    """
+    return _NOT_PLAIN_ASCII.search(content) is None
+
+
+def _decode_text(content: "mmap.mmap | bytes") -> str:
+    """Decode file contents the way Path.read_text() does.
+
+    Args:
+        content: File contents, as yielded by FileVerifier._map_file.
+
+    Returns:
+        The UTF-8 text, with "\r\n" and "\r" translated to "\n".
+
+    Raises:
+        UnicodeDecodeError: If the contents are not valid UTF-8.
+    """
+    text = content[:].decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_bytes(pattern: str) -> "re.Pattern[bytes] | None":
+    """Compile a str regex for searching plain ASCII file bytes, memoized.
+
+    On contents passing _is_plain_ascii(), the result matches exactly
+    where the str pattern matches the decoded text.
+
+    Args:
+        pattern: Regular expression pattern as passed by callers.
+
+    Returns:
+        The compiled bytes-mode pattern, or None if the pattern is not
+        ASCII, uses escapes only str patterns support (\\u, \\U, \\N) or
+        is invalid. Callers then fall back to the str pattern.
+    """
+    if not pattern.isascii():
+        return None
+    try:
+        return re.compile(pattern.encode("ascii"))
+    except re.error:
+        return None
+
+
+def _preview(content: "mmap.mmap | bytes", limit: int = 500) -> str:
+    """Decode the start of a file for a failure message.
+
+    Only the first limit bytes are sliced off the mapping and decoded, so
+    building a preview never copies the whole file.
+
+    Args:
+        content: File contents, as yielded by FileVerifier._map_file.
+        limit: Maximum number of bytes to show.
+
+    Returns:
+        The decoded preview, with "..." appended if it was truncated.
+    """
+    preview = content[:limit].decode("utf-8", errors="replace")
+    if len(content) > limit:
+        preview += "..."
+    return preview
+
+
+# Line boundaries str.splitlines() recognizes in plain ASCII contents
+_LINE_BREAKS = re.compile(rb"[\n\v\f]")
+
+
+# Characters with a special meaning in a (non-verbose) regular expression
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_bytes(pattern: str) -> bytes | None:
+    """Get the UTF-8 bytes of a pattern that only matches itself, memoized.
+
+    Args:
+        pattern: Regular expression pattern as passed by callers.
+
+    Returns:
+        The encoded pattern if it is non-empty and free of regex
+        metacharacters, otherwise None.
+    """
+    if not pattern or not _REGEX_META.isdisjoint(pattern):
+        return None
+    return pattern.encode("utf-8")
+
+
+# Tool and dependency directories find_file() does not descend into, since
+# they can hold many thousands of files and never contain test artifacts
+_FIND_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+    }
+)
+
+
+# Characters taken by the escapes \\x, \\u and \\U after the escape letter
+_ESCAPE_ARG_LENGTHS = {"x": 2, "u": 4, "U": 8}
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_tail(pattern: str) -> str:
+    """Get literal text that every match of a path pattern must contain, memoized.
+
+    This is the run of plain characters and escaped punctuation at the end
+    of the pattern (before an optional "$"), e.g. "/spec.md" for
+    ``r"specs/\\d+-.*/spec\\.md"``. Escapes with a letter or digit
+    (classes, anchors, \\x2e, \\056, backreferences) end the run, along
+    with their arguments. Patterns using alternation, or the IGNORECASE or
+    VERBOSE flags, yield no tail, since their matches need not contain it.
+
+    Args:
+        pattern: Regular expression pattern as passed by callers.
+
+    Returns:
+        The literal tail, or an empty string if there is none.
+    """
+    if "|" in pattern or re.compile(pattern).flags & (re.IGNORECASE | re.VERBOSE):
+        return ""
+
+    chars: list[str] = []
+    i = 0
+    end = len(pattern)
+    while i < end:
+        char = pattern[i]
+        if char == "\\" and i + 1 < end:
+            escaped = pattern[i + 1]
+            i += 2
+            if not escaped.isalnum():
+                chars.append(escaped)
+                continue
+            chars.clear()
+            # Skip the escape's arguments too, so none read as literal text
+            if escaped in _ESCAPE_ARG_LENGTHS:
+                i += _ESCAPE_ARG_LENGTHS[escaped]
+            elif escaped == "N":
+                closing = pattern.find("}", i)
+                i = end if closing == -1 else closing + 1
+            elif escaped.isdigit():
+                # Octal escapes take up to three digits, backreferences two
+                digits = 0
+                while i < end and digits < 2 and pattern[i].isdigit():
+                    i += 1
+                    digits += 1
+        elif char in _REGEX_META:
+            if char == "$" and i == end - 1:
+                break  # A final anchor adds no text
+            chars.clear()
+            i += 1
+        else:
+            chars.append(char)
+            i += 1
+    return "".join(chars)
 
 
 class FileVerifier:
@@ -32,17 +214,155 @@ class FileVerifier:
                 All path arguments to methods are resolved relative to this.
         """
         self.base_path = base_path
+        # String form of base_path, so resolving paths skips pathlib
+        self._base_str = os.fspath(base_path)
 
-    def _resolve_path(self, path: str) -> Path:
+    def _resolve_path(self, path: str) -> str:
         """Resolve a relative path against the base path.
 
+        Returns a plain string: the assertions only need os.stat()
+        and open(), so no Path object is built per call.
+
         Args:
             path: Relative path string.
 
         Returns:
-            Absolute Path object.
+            Resolved path string.
+        """
+        return os.path.join(self._base_str, path)
+
+    @staticmethod
+    def _stat(full_path: str) -> "os.stat_result | None":
+        """Stat a path once, for both the existence and the type check.
+
+        Like Path.exists(), a path below a regular file or through a
+        symlink loop counts as missing rather than raising.
+
+        Args:
+            full_path: Resolved path to stat.
+
+        Returns:
+            The stat result, or None if nothing exists at the path.
+        """
+        try:
+            return os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError as e:
+            if e.errno == errno.ELOOP:
+                return None
+            raise
+
+    @contextlib.contextmanager
+    def _map_file(self, full_path: str) -> Iterator["mmap.mmap | bytes"]:
+        """Map a file read-only into memory for byte-level scanning.
+
+        The kernel pages the contents in on demand, and on plain ASCII
+        contents regex searches run on the raw bytes, so no decoded copy of
+        the file is built. Empty files cannot be mapped and yield b"" instead.
+
+        Args:
+            full_path: Resolved path to the file.
+
+        Yields:
+            A read-only mmap of the file, or b"" for an empty file.
+
+        Raises:
+            OSError: If the file cannot be opened or mapped.
+        """
+        with open(full_path, "rb") as f:
+            if f.seek(0, 2) == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def _stat_file(
+        self, path: "str | Path", full_path: str, what: str, description: str
+    ) -> os.stat_result:
+        """Stat the regular file an assertion is about to read.
+
+        Args:
+            path: Path as given by the caller, for error messages.
+            full_path: Resolved path to the file.
+            what: Message prefix naming the failed check, e.g.
+                "Cannot count lines in 'data.csv'".
+            description: Human-readable description for error messages.
+
+        Returns:
+            The stat result of the file.
+
+        Raises:
+            AssertionError: If the path does not exist or is not a file.
+        """
+        st = self._stat(full_path)
+
+        if st is None:
+            raise AssertionError(
+                f"{description}: {what} - file does not exist at '{full_path}'."
+            )
+
+        if not stat.S_ISREG(st.st_mode):
+            raise AssertionError(
+                f"{description}: {what} - path is a directory, not a file."
+            )
+
+        return st
+
+    @contextlib.contextmanager
+    def _read_for_check(
+        self, path: "str | Path", full_path: str, description: str
+    ) -> Iterator["mmap.mmap | bytes"]:
+        """Map a checked file, reporting read errors as assertion failures.
+
+        Args:
+            path: Path as given by the caller, for error messages.
+            full_path: Resolved path to the file.
+            description: Human-readable description for error messages.
+
+        Yields:
+            The file contents, as from _map_file.
+
+        Raises:
+            AssertionError: If the file cannot be opened or mapped.
+        """
+        try:
+            with self._map_file(full_path) as content:
+                yield content
+        except OSError as e:
+            raise AssertionError(
+                f"{description}: Cannot read file '{path}' at "
+                f"'{full_path}': {e}"
+            ) from e
+
+    def _text_for_check(
+        self,
+        content: "mmap.mmap | bytes",
+        path: "str | Path",
+        full_path: str,
+        description: str,
+    ) -> str:
+        """Decode checked file contents, reporting errors as assertion failures.
+
+        Args:
+            content: File contents, as yielded by _read_for_check.
+            path: Path as given by the caller, for error messages.
+            full_path: Resolved path to the file.
+            description: Human-readable description for error messages.
+
+        Returns:
+            The decoded text, as from _decode_text.
+
+        Raises:
+            AssertionError: If the file is not valid UTF-8.
         """
-        return self.base_path / path
+        try:
+            return _decode_text(content)
+        except UnicodeDecodeError as e:
+            raise AssertionError(
+                f"{description}: Cannot read file '{path}' at "
+                f"'{full_path}': {e}"
+            ) from e
 
     def assert_exists(self, path: str, description: str) -> None:
         """Assert that a file exists at the given path.
@@ -58,14 +378,15 @@ class FileVerifier:
             >>> verifier.assert_exists("src/main.py", "Main entry point")
         """
         full_path = self._resolve_path(path)
+        st = self._stat(full_path)
 
-        if not full_path.exists():
+        if st is None:
             raise AssertionError(
                 f"{description}: Expected file '{path}' to exist at "
                 f"'{full_path}', but it was not found."
             )
 
-        if not full_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise AssertionError(
                 f"{description}: Expected '{path}' to be a file at "
                 f"'{full_path}', but it is a directory."
@@ -85,14 +406,15 @@ class FileVerifier:
             >>> verifier.assert_dir_exists("src/", "Source directory")
         """
         full_path = self._resolve_path(path)
+        st = self._stat(full_path)
 
-        if not full_path.exists():
+        if st is None:
             raise AssertionError(
                 f"{description}: Expected directory '{path}' to exist at "
                 f"'{full_path}', but it was not found."
             )
 
-        if not full_path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise AssertionError(
                 f"{description}: Expected '{path}' to be a directory at "
                 f"'{full_path}', but it is a file."
@@ -121,38 +443,95 @@ class FileVerifier:
             ... )
         """
         if isinstance(path, Path):
-            full_path = path
+            full_path = os.fspath(path)
         else:
             full_path = self._resolve_path(path)
+        self._stat_file(
+            path, full_path, f"Cannot check pattern in '{path}'", description
+        )
+
+        with self._read_for_check(path, full_path, description) as content:
+            regex = _compile_bytes(pattern) if _is_plain_ascii(content) else None
+            if regex is not None:
+                found = regex.search(content) is not None
+            else:
+                text = self._text_for_check(content, path, full_path, description)
+                found = re.search(pattern, text) is not None
+            if found:
+                return
+            preview = _preview(content)
+
+        raise AssertionError(
+            f"{description}: Expected file '{path}' to contain pattern "
+            f"'{pattern}', but pattern was not found.\n"
+            f"File content preview:\n{preview}"
+        )
+
+    def assert_contains_all(
+        self, path: str | Path, checks: "list[tuple[str, str]]"
+    ) -> None:
+        """Assert that a file contains content matching each of several patterns.
 
-        if not full_path.exists():
-            raise AssertionError(
-                f"{description}: Cannot check pattern in '{path}' - "
-                f"file does not exist at '{full_path}'."
-            )
+        Equivalent to calling assert_contains() once per check, but the file
+        is opened and mapped once, and every missing pattern is reported
+        together.
 
-        if not full_path.is_file():
-            raise AssertionError(
-                f"{description}: Cannot check pattern in '{path}' - "
-                f"path is a directory, not a file."
-            )
+        Args:
+            path: Path to the file. Can be a relative string path (resolved
+                against base_path) or an absolute Path object.
+            checks: (pattern, description) pairs, as passed to assert_contains().
 
-        try:
-            content = full_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as e:
-            raise AssertionError(
-                f"{description}: Cannot read file '{path}' at "
-                f"'{full_path}': {e}"
-            ) from e
+        Raises:
+            AssertionError: If the file does not exist or any pattern is
+                not found.
 
-        if not re.search(pattern, content):
-            # Truncate content for error message if too long
-            preview = content[:500] + "..." if len(content) > 500 else content
-            raise AssertionError(
-                f"{description}: Expected file '{path}' to contain pattern "
-                f"'{pattern}', but pattern was not found.\n"
-                f"File content preview:\n{preview}"
-            )
+        Example:
+            >>> verifier.assert_contains_all(
+            ...     "spec.md",
+            ...     [
+            ...         (r"(?i)#.*requirements?", "Requirements section header"),
+            ...         (r"(?i)#.*success\\s+criteria", "Success Criteria section"),
+            ...     ],
+            ... )
+        """
+        if isinstance(path, Path):
+            full_path = os.fspath(path)
+        else:
+            full_path = self._resolve_path(path)
+        description = f"{len(checks)} required patterns"
+        self._stat_file(
+            path, full_path, f"Cannot check patterns in '{path}'", description
+        )
+
+        with self._read_for_check(path, full_path, description) as content:
+            plain = _is_plain_ascii(content)
+            text = None
+            missing = []
+            for pattern, desc in checks:
+                regex = _compile_bytes(pattern) if plain else None
+                if regex is not None:
+                    found = regex.search(content) is not None
+                else:
+                    # Decode at most once, for the first pattern needing it
+                    if text is None:
+                        text = self._text_for_check(
+                            content, path, full_path, description
+                        )
+                    found = re.search(pattern, text) is not None
+                if not found:
+                    missing.append((pattern, desc))
+            if not missing:
+                return
+            preview = _preview(content)
+
+        details = "\n".join(
+            f"  {desc}: pattern '{pattern}' was not found" for pattern, desc in missing
+        )
+        raise AssertionError(
+            f"Expected file '{path}' to contain all required patterns, "
+            f"but {len(missing)} of {len(checks)} were not found:\n{details}\n"
+            f"File content preview:\n{preview}"
+        )
 
     def assert_not_empty(self, path: str, description: str) -> None:
         """Assert that a file is not empty.
@@ -168,28 +547,25 @@ class FileVerifier:
             >>> verifier.assert_not_empty("output.log", "Output log file")
         """
         full_path = self._resolve_path(path)
+        st = self._stat_file(
+            path, full_path, f"Cannot check if '{path}' is empty", description
+        )
 
-        if not full_path.exists():
+        if st.st_size == 0:
             raise AssertionError(
-                f"{description}: Cannot check if '{path}' is empty - "
-                f"file does not exist at '{full_path}'."
+                f"{description}: Expected file '{path}' to not be empty, "
+                f"but it is empty or contains only whitespace."
             )
 
-        if not full_path.is_file():
-            raise AssertionError(
-                f"{description}: Cannot check if '{path}' is empty - "
-                f"path is a directory, not a file."
-            )
+        with self._read_for_check(path, full_path, description) as content:
+            if _is_plain_ascii(content):
+                # Any non-whitespace byte means the file is not blank
+                is_blank = re.search(rb"\S", content) is None
+            else:
+                text = self._text_for_check(content, path, full_path, description)
+                is_blank = not text.strip()
 
-        try:
-            content = full_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as e:
-            raise AssertionError(
-                f"{description}: Cannot read file '{path}' at "
-                f"'{full_path}': {e}"
-            ) from e
-
-        if not content.strip():
+        if is_blank:
             raise AssertionError(
                 f"{description}: Expected file '{path}' to not be empty, "
                 f"but it is empty or contains only whitespace."
@@ -211,28 +587,35 @@ class FileVerifier:
             >>> verifier.assert_min_lines("data.csv", 10, "Data file")
         """
         full_path = self._resolve_path(path)
+        st = self._stat_file(
+            path, full_path, f"Cannot count lines in '{path}'", description
+        )
 
-        if not full_path.exists():
+        # Every line takes at least one byte, so a smaller file can be
+        # rejected without reading it
+        if st.st_size < min_lines:
             raise AssertionError(
-                f"{description}: Cannot count lines in '{path}' - "
-                f"file does not exist at '{full_path}'."
-            )
-
-        if not full_path.is_file():
-            raise AssertionError(
-                f"{description}: Cannot count lines in '{path}' - "
-                f"path is a directory, not a file."
+                f"{description}: Expected file '{path}' to have at least "
+                f"{min_lines} lines, but its size of {st.st_size} bytes "
+                f"cannot hold that many."
             )
 
-        try:
-            content = full_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as e:
-            raise AssertionError(
-                f"{description}: Cannot read file '{path}' at "
-                f"'{full_path}': {e}"
-            ) from e
-
-        line_count = len(content.splitlines())
+        with self._read_for_check(path, full_path, description) as content:
+            if _is_plain_ascii(content):
+                # Count the line boundaries str.splitlines() knows among
+                # these bytes, stopping once enough are found; a final
+                # line without one still counts
+                line_count = 0
+                for _ in _LINE_BREAKS.finditer(content):
+                    line_count += 1
+                    if line_count >= min_lines:
+                        break
+                else:
+                    if content[-1:] not in (b"", b"\n", b"\v", b"\f"):
+                        line_count += 1
+            else:
+                text = self._text_for_check(content, path, full_path, description)
+                line_count = len(text.splitlines())
 
         if line_count < min_lines:
             raise AssertionError(
@@ -254,28 +637,50 @@ class FileVerifier:
             FileNotFoundError: If the file does not exist.
             IsADirectoryError: If the path is a directory.
             OSError: If the file cannot be read.
+            UnicodeDecodeError: If the file is not valid UTF-8.
 
         Example:
             >>> count = verifier.count_pattern("log.txt", r"ERROR:")
             >>> print(f"Found {count} errors")
         """
         full_path = self._resolve_path(path)
+        st = self._stat(full_path)
 
-        if not full_path.exists():
+        if st is None:
             raise FileNotFoundError(
                 f"Cannot count pattern in '{path}' - "
                 f"file does not exist at '{full_path}'."
             )
 
-        if not full_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise IsADirectoryError(
                 f"Cannot count pattern in '{path}' - "
                 f"path is a directory, not a file."
             )
 
-        content = full_path.read_text(encoding="utf-8")
-        matches = re.findall(pattern, content)
-        return len(matches)
+        with self._map_file(full_path) as content:
+            if not _is_plain_ascii(content):
+                text = _decode_text(content)
+                if _literal_bytes(pattern) is not None:
+                    return text.count(pattern)
+                return sum(1 for _ in re.finditer(pattern, text))
+
+            literal = _literal_bytes(pattern)
+            if literal is None:
+                # Count lazily instead of materializing the list of matches
+                regex = _compile_bytes(pattern)
+                if regex is None:
+                    return sum(1 for _ in re.finditer(pattern, _decode_text(content)))
+                return sum(1 for _ in regex.finditer(content))
+
+            # Plain text needs no regex engine: step through non-overlapping
+            # occurrences with find() (mmap has no count())
+            count = 0
+            found = content.find(literal)
+            while found != -1:
+                count += 1
+                found = content.find(literal, found + len(literal))
+            return count
 
     def find_file(
         self,
@@ -284,6 +689,10 @@ class FileVerifier:
     ) -> Path | None:
         """Find a file matching a regex pattern.
 
+        Tool and dependency directories (.git, node_modules, .venv,
+        __pycache__ and similar caches) are not searched, unless the
+        pattern names them.
+
         Args:
             pattern: Regular expression pattern to match against file paths
                 (relative to base_path). The pattern is matched against the
@@ -304,17 +713,27 @@ class FileVerifier:
         """
         search_path = base_path if base_path is not None else self.base_path
         regex = re.compile(pattern)
-
-        # Walk the directory tree to find matching files
-        for file_path in search_path.rglob("*"):
-            if file_path.is_file():
-                # Get the relative path from base for matching
-                try:
-                    relative = file_path.relative_to(search_path)
-                    if regex.search(str(relative)):
-                        return file_path
-                except ValueError:
-                    # Path is not relative to search_path, skip
+        # Cheap substring test that rules out most paths before the regex
+        tail = _literal_tail(pattern)
+        skip_dirs = {name for name in _FIND_SKIP_DIRS if name not in pattern}
+        root = os.fspath(search_path)
+
+        # Walk the directory tree to find matching files. os.walk lists
+        # each directory with scandir and classifies entries from the
+        # directory listing, so candidates cost no per-file stat call.
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Prune in place so os.walk never lists the skipped directories
+            if skip_dirs and not skip_dirs.isdisjoint(dirnames):
+                dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+            # Relative directory prefix, empty for the search root itself
+            rel_dir = dirpath[len(root) :].lstrip(os.sep)
+            for name in filenames:
+                relative = os.path.join(rel_dir, name)
+                if tail not in relative or not regex.search(relative):
                     continue
+                full_path = os.path.join(dirpath, name)
+                # Symlinks land in filenames too; keep only real files
+                if os.path.isfile(full_path):
+                    return Path(full_path)
 
         return None
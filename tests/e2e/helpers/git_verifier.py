@@ -4,11 +4,64 @@ This module provides utilities for asserting git repository state,
 including branch names, worktrees, and commit history.
 """
 
+import functools
+import itertools
 import re
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> "re.Pattern[str]":
+    """Compile a regex pattern, memoized.
+
+    Args:
+        pattern: Regular expression pattern as passed by callers.
+
+    Returns:
+        The compiled pattern.
+    """
+    return re.compile(pattern)
+
+
+def _count_matches(messages: list[str], regex: "re.Pattern[str]", limit: int) -> int:
+    """Count non-empty messages matching a regex, stopping at a limit.
+
+    Assertions only need to know whether enough commits match, so the
+    scan ends as soon as ``limit`` matches are found. Filtering is done
+    by ``filter`` and ``islice``, keeping the loop out of Python code.
+
+    Args:
+        messages: Commit subjects to scan.
+        regex: Compiled pattern to search each subject with.
+        limit: Count at which to stop scanning.
+
+    Returns:
+        The number of matches found, at most ``limit``.
+    """
+    matches = filter(regex.search, filter(None, messages))
+    return sum(1 for _ in itertools.islice(matches, limit))
+
+
+@dataclass(frozen=True, slots=True)
+class _RepoSnapshot:
+    """Repository state read by one GitVerifier._snapshot() call.
+
+    Each field holds the exit status and the stripped output of one git
+    command: its stdout when it succeeded, its stderr when it failed.
+
+    Attributes:
+        is_inside_work_tree: Result of ``git rev-parse --is-inside-work-tree``.
+        current_branch: Result of ``git branch --show-current``.
+        commit_count: Result of ``git rev-list --count HEAD``.
+    """
+
+    is_inside_work_tree: tuple[int, str]
+    current_branch: tuple[int, str]
+    commit_count: tuple[int, str]
+
+
 class GitVerifier:
     """Utility for asserting git repository state.
 
@@ -19,12 +72,32 @@ class GitVerifier:
     Attributes:
         repo_path: Path to the git repository root.
 
+    Repository state (whether it is a repo, the current branch, the
+    commit count and the worktree list) is read from git once and cached.
+    Call refresh() after anything changes the repository.
+
     Example:
         >>> verifier = GitVerifier(Path("/path/to/repo"))
         >>> verifier.assert_is_repo()
         >>> verifier.assert_branch_matches(r"feature/.*", "feature branch")
     """
 
+    # Shell script running the snapshot commands in one spawn. Each command
+    # emits "<status> <output>" terminated by NUL, so multi-line error
+    # messages cannot break the parsing. The output is stdout alone, since
+    # git may warn on stderr and still succeed; only a failed command is
+    # run again to capture its stderr for the error message.
+    _SNAPSHOT_SCRIPT = "; ".join(
+        f'out=$(git {args} 2>/dev/null); s=$?; '
+        f'[ "$s" -eq 0 ] || out=$(git {args} 2>&1 >/dev/null); '
+        f'printf "%s %s\\0" "$s" "$out"'
+        for args in (
+            "rev-parse --is-inside-work-tree",
+            "branch --show-current",
+            "rev-list --count HEAD",
+        )
+    )
+
     def __init__(self, repo_path: Path) -> None:
         """Initialize the GitVerifier.
 
@@ -32,6 +105,39 @@ class GitVerifier:
             repo_path: Path to the git repository root.
         """
         self.repo_path = repo_path
+        self._snapshot_cache: _RepoSnapshot | None = None
+        # Commit subjects per repository/worktree path, newest first
+        self._commit_messages_cache: dict[Path, list[str]] = {}
+        self._worktrees_cache: list[Path] | None = None
+
+    def refresh(self) -> None:
+        """Forget cached repository state.
+
+        The next assertion reads the state from git again.
+        """
+        self._snapshot_cache = None
+        self._commit_messages_cache.clear()
+        self._worktrees_cache = None
+
+    def _snapshot(self) -> _RepoSnapshot:
+        """Return the repository state, reading it from git if not cached.
+
+        Returns:
+            The cached or freshly read repository state.
+        """
+        if self._snapshot_cache is None:
+            result = subprocess.run(
+                ["sh", "-c", self._SNAPSHOT_SCRIPT],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+            )
+            fields = []
+            for record in result.stdout.split("\0")[:3]:
+                status, _, output = record.partition(" ")
+                fields.append((int(status), output.strip()))
+            self._snapshot_cache = _RepoSnapshot(*fields)
+        return self._snapshot_cache
 
     def _run_git_command(self, args: list[str]) -> subprocess.CompletedProcess[str]:
         """Run a git command and return the result.
@@ -55,11 +161,11 @@ class GitVerifier:
         Raises:
             AssertionError: If the path is not a git repository.
         """
-        result = self._run_git_command(["rev-parse", "--is-inside-work-tree"])
-        if result.returncode != 0 or result.stdout.strip() != "true":
+        status, output = self._snapshot().is_inside_work_tree
+        if status != 0 or output != "true":
             raise AssertionError(
                 f"Expected '{self.repo_path}' to be a git repository, "
-                f"but git rev-parse failed: {result.stderr.strip()}"
+                f"but git rev-parse failed: {output if status != 0 else ''}"
             )
 
     def assert_branch_matches(self, pattern: str, description: str) -> None:
@@ -72,15 +178,14 @@ class GitVerifier:
         Raises:
             AssertionError: If the branch name doesn't match the pattern.
         """
-        result = self._run_git_command(["branch", "--show-current"])
-        if result.returncode != 0:
+        status, branch_name = self._snapshot().current_branch
+        if status != 0:
             raise AssertionError(
                 f"Expected {description}, but failed to get current branch: "
-                f"{result.stderr.strip()}"
+                f"{branch_name}"
             )
 
-        branch_name = result.stdout.strip()
-        if not re.search(pattern, branch_name):
+        if not _compile(pattern).search(branch_name):
             raise AssertionError(
                 f"Expected {description} matching pattern '{pattern}', "
                 f"but found branch '{branch_name}'"
@@ -95,16 +200,17 @@ class GitVerifier:
         Raises:
             AssertionError: If no worktree matches the pattern.
         """
-        result = self._run_git_command(["worktree", "list", "--porcelain"])
-        if result.returncode != 0:
+        try:
+            worktrees = self._worktrees()
+        except RuntimeError as e:
             raise AssertionError(
                 f"Expected worktree matching '{pattern}', but failed to list worktrees: "
-                f"{result.stderr.strip()}"
-            )
+                f"{e}"
+            ) from e
 
-        worktrees = self._parse_worktrees(result.stdout)
+        regex = _compile(pattern)
         for worktree_path in worktrees:
-            if re.search(pattern, str(worktree_path)):
+            if regex.search(str(worktree_path)):
                 return
 
         raise AssertionError(
@@ -124,20 +230,66 @@ class GitVerifier:
         Raises:
             RuntimeError: If git worktree list command fails.
         """
-        result = self._run_git_command(["worktree", "list", "--porcelain"])
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"git worktree list failed (exit code {result.returncode}): "
-                f"{result.stderr.strip()}"
-            )
-
-        worktrees = self._parse_worktrees(result.stdout)
-        for worktree_path in worktrees:
-            if re.search(pattern, str(worktree_path)):
+        regex = _compile(pattern)
+        for worktree_path in self._worktrees():
+            if regex.search(str(worktree_path)):
                 return worktree_path
 
         return None
 
+    def _all_commit_messages(self, path: Path | None = None) -> list[str]:
+        """Return the commit subjects reachable from HEAD, reading them once.
+
+        The log is read with a single git call per path and cached until
+        refresh(), so any number of pattern queries share it.
+
+        Args:
+            path: Optional path to read the log at (for worktrees).
+                Defaults to repo_path.
+
+        Returns:
+            Commit subjects, newest first.
+
+        Raises:
+            RuntimeError: If git log fails. The message is git's error output.
+        """
+        git_path = path if path is not None else self.repo_path
+        messages = self._commit_messages_cache.get(git_path)
+        if messages is None:
+            result = subprocess.run(
+                ["git", "log", "--format=%s"],
+                cwd=git_path,
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip())
+            messages = result.stdout.splitlines()
+            self._commit_messages_cache[git_path] = messages
+        return messages
+
+    def _worktrees(self) -> list[Path]:
+        """Return the repository's worktree paths, listing them once.
+
+        The list is cached until refresh(), so checking for a worktree and
+        then looking up its path costs a single git call.
+
+        Returns:
+            Worktree paths in the order git lists them.
+
+        Raises:
+            RuntimeError: If git worktree list fails.
+        """
+        if self._worktrees_cache is None:
+            result = self._run_git_command(["worktree", "list", "--porcelain"])
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"git worktree list failed (exit code {result.returncode}): "
+                    f"{result.stderr.strip()}"
+                )
+            self._worktrees_cache = self._parse_worktrees(result.stdout)
+        return self._worktrees_cache
+
     def _parse_worktrees(self, porcelain_output: str) -> list[Path]:
         """Parse git worktree list --porcelain output.
 
@@ -147,12 +299,12 @@ class GitVerifier:
         Returns:
             List of Path objects for each worktree.
         """
-        worktrees = []
-        for line in porcelain_output.split("\n"):
-            if line.startswith("worktree "):
-                path_str = line[len("worktree ") :]
-                worktrees.append(Path(path_str))
-        return worktrees
+        prefix = "worktree "
+        return [
+            Path(line[len(prefix) :])
+            for line in porcelain_output.splitlines()
+            if line.startswith(prefix)
+        ]
 
     def assert_min_commits(
         self,
@@ -178,22 +330,14 @@ class GitVerifier:
         # Build git command
         if message_pattern:
             # Filter by message pattern
-            result = subprocess.run(
-                ["git", "log", "--oneline", "--format=%s"],
-                cwd=git_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
+            try:
+                commit_messages = self._all_commit_messages(git_path)
+            except RuntimeError as e:
                 raise AssertionError(
-                    f"Failed to get commit log at '{git_path}': {result.stderr.strip()}"
-                )
-
-            commit_messages = result.stdout.strip().split("\n")
-            matching_commits = [
-                msg for msg in commit_messages if msg and re.search(message_pattern, msg)
-            ]
-            matching_count = len(matching_commits)
+                    f"Failed to get commit log at '{git_path}': {e}"
+                ) from e
+            regex = _compile(message_pattern)
+            matching_count = _count_matches(commit_messages, regex, count)
 
             if matching_count < count:
                 desc = description or f"commits matching '{message_pattern}'"
@@ -203,22 +347,29 @@ class GitVerifier:
                     f"Recent commit messages: {commit_messages[:10]}"
                 )
         else:
-            # Count all commits
-            result = subprocess.run(
-                ["git", "rev-list", "--count", "HEAD"],
-                cwd=git_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
+            # Count all commits, reusing the cached count for the main repo
+            if git_path == self.repo_path:
+                status, output = self._snapshot().commit_count
+            else:
+                result = subprocess.run(
+                    ["git", "rev-list", "--count", "HEAD"],
+                    cwd=git_path,
+                    capture_output=True,
+                    text=True,
+                )
+                status = result.returncode
+                output = (result.stdout if status == 0 else result.stderr).strip()
+            if status != 0:
                 raise AssertionError(
-                    f"Failed to count commits at '{git_path}': {result.stderr.strip()}"
+                    f"Failed to count commits at '{git_path}': {output}"
                 )
 
             try:
-                commit_count = int(result.stdout.strip())
-            except ValueError:
-                commit_count = 0
+                commit_count = int(output)
+            except ValueError as e:
+                raise AssertionError(
+                    f"Failed to parse commit count at '{git_path}': '{output}'"
+                ) from e
 
             if commit_count < count:
                 desc = description or "commits"
@@ -240,19 +391,18 @@ class GitVerifier:
         Raises:
             AssertionError: If insufficient matching commits exist.
         """
-        result = self._run_git_command(["log", "--oneline", "--format=%s"])
-        if result.returncode != 0:
+        try:
+            commit_messages = self._all_commit_messages()
+        except RuntimeError as e:
             raise AssertionError(
                 f"Expected {description} with commits matching '{pattern}', "
-                f"but failed to get commit log: {result.stderr.strip()}"
+                f"but failed to get commit log: {e}"
+            ) from e
+        regex = _compile(pattern)
+        if _count_matches(commit_messages, regex, min_count) < min_count:
+            matching_commits = list(
+                filter(regex.search, filter(None, commit_messages))
             )
-
-        commit_messages = result.stdout.strip().split("\n")
-        matching_commits = [
-            msg for msg in commit_messages if msg and re.search(pattern, msg)
-        ]
-
-        if len(matching_commits) < min_count:
             raise AssertionError(
                 f"Expected {description} with at least {min_count} commits "
                 f"matching pattern '{pattern}', but found only {len(matching_commits)} "
@@ -269,18 +419,17 @@ class GitVerifier:
             RuntimeError: If git rev-list command fails.
             ValueError: If the command output cannot be parsed as an integer.
         """
-        result = self._run_git_command(["rev-list", "--count", "HEAD"])
-        if result.returncode != 0:
+        status, output = self._snapshot().commit_count
+        if status != 0:
             raise RuntimeError(
-                f"git rev-list --count HEAD failed (exit code {result.returncode}): "
-                f"{result.stderr.strip()}"
+                f"git rev-list --count HEAD failed (exit code {status}): {output}"
             )
 
         try:
-            return int(result.stdout.strip())
+            return int(output)
         except ValueError as e:
             raise ValueError(
-                f"Failed to parse commit count from git output: '{result.stdout.strip()}'"
+                f"Failed to parse commit count from git output: '{output}'"
             ) from e
 
     def count_worktrees(self) -> int:
@@ -292,12 +441,4 @@ class GitVerifier:
         Raises:
             RuntimeError: If git worktree list command fails.
         """
-        result = self._run_git_command(["worktree", "list", "--porcelain"])
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"git worktree list failed (exit code {result.returncode}): "
-                f"{result.stderr.strip()}"
-            )
-
-        worktrees = self._parse_worktrees(result.stdout)
-        return len(worktrees)
+        return len(self._worktrees())
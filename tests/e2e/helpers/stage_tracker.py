@@ -0,0 +1,306 @@
+"""Stage dependency tracking for E2E tests.
+
+This module records the outcome of each numbered E2E stage and decides
+which later stages must be skipped. If stage N fails, all stages > N are
+skipped, because each stage builds on the project state left behind by
+the previous ones.
+
+State lives in module globals and is driven by the pytest hooks in
+``tests/e2e/conftest.py``. Under pytest-xdist the state can be shared
+between workers through a memory-mapped file (see attach()).
+"""
+
+import mmap
+import os
+import sys
+from enum import IntEnum
+from pathlib import Path
+
+
+class StageStatus(IntEnum):
+    """Enum representing test stage execution status.
+
+    Used by the stage tracking functions to record the execution state of
+    each test stage in the E2E test pipeline. Stages progress through these
+    states during test execution.
+
+    Members are small integers so status comparisons and stores are plain
+    int operations; use ``.name`` when a readable label is needed.
+
+    Attributes:
+        PENDING: Stage not yet executed.
+        PASSED: Stage completed successfully.
+        FAILED: Stage failed with an error.
+        SKIPPED: Stage skipped due to dependency failure.
+    """
+
+    PENDING = 0
+    """Stage not yet executed."""
+
+    PASSED = 1
+    """Stage completed successfully."""
+
+    FAILED = 2
+    """Stage failed with error."""
+
+    SKIPPED = 3
+    """Stage skipped due to dependency failure."""
+
+
+# Highest valid stage number; stage numbers index _stage_status directly.
+_MAX_STAGE = 6
+
+# Byte of _stage_status holding the first failing stage (0 = no failure).
+_FIRST_FAILURE_INDEX = _MAX_STAGE + 1
+
+# StageStatus members indexed by value, for decoding _stage_status bytes.
+_STATUSES: tuple[StageStatus, ...] = tuple(StageStatus)
+
+# Stage tracking state for the current pytest process. Stage hooks run
+# sequentially in one interpreter, so plain module globals are sufficient and
+# keep every hook-side update a direct index/global access. _stage_status
+# holds one StageStatus value per byte (zero-filled, i.e. PENDING); index 0
+# is unused so that stage N lives at index N, and the byte after the last
+# stage records the first failure. Inside an xdist worker it is replaced by
+# an mmap of a file shared by all workers of the run (see attach()), so a
+# failure seen by one worker also skips dependent stages on the others.
+_stage_status: bytearray | mmap.mmap = bytearray(_FIRST_FAILURE_INDEX + 1)
+_first_failure: int | None = None
+# Stages strictly above this boundary are skipped. Mirrors _first_failure but
+# uses sys.maxsize instead of None so should_skip() is a single comparison.
+_skip_threshold: int = sys.maxsize
+
+
+def _record_first_failure(stage: int) -> None:
+    """Record the first failing stage and update the skip boundary.
+
+    Args:
+        stage: The stage number that failed first.
+    """
+    global _first_failure, _skip_threshold
+    _first_failure = stage
+    _skip_threshold = stage
+
+
+def _sync_first_failure() -> None:
+    """Adopt a first failure recorded by another xdist worker, if any."""
+    stage = _stage_status[_FIRST_FAILURE_INDEX]
+    if stage:
+        _record_first_failure(stage)
+
+
+def attach(state_file: Path) -> None:
+    """Back the stage state with a memory-mapped file shared across processes.
+
+    Used by pytest-xdist workers: every worker of a run attaches to the same
+    file, so stage results and the first failure recorded by one worker are
+    seen by all others. The file is created (zero-filled) if missing; its
+    existing contents are kept otherwise. Any previous attachment is
+    released first.
+
+    Args:
+        state_file: Path of the shared state file.
+    """
+    global _stage_status
+    detach()
+    size = len(_stage_status)
+    fd = os.open(state_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        # Zero-extends a new file; a no-op once another process sized it
+        os.ftruncate(fd, size)
+        _stage_status = mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+
+
+def detach() -> None:
+    """Release the shared state file, keeping a private copy of its state.
+
+    Does nothing if attach() has not been called.
+    """
+    global _stage_status
+    if isinstance(_stage_status, mmap.mmap):
+        shared = _stage_status
+        _stage_status = bytearray(shared)
+        shared.close()
+
+
+def validate_stage(stage: int) -> None:
+    """Check that a stage number is one the tracker can record.
+
+    Stage numbers index _stage_status directly, so an out-of-range stage
+    would overwrite the first-failure byte or fall off the end.
+
+    Args:
+        stage: The stage number to check.
+
+    Raises:
+        ValueError: If stage is not between 1 and _MAX_STAGE.
+    """
+    if not 1 <= stage <= _MAX_STAGE:
+        raise ValueError(
+            f"Invalid stage: {stage}. Must be between 1 and {_MAX_STAGE}."
+        )
+
+
+def mark_passed(stage: int) -> None:
+    """Mark a stage as passed.
+
+    Args:
+        stage: The stage number that passed.
+
+    Raises:
+        ValueError: If stage is not a valid stage number.
+    """
+    validate_stage(stage)
+    _stage_status[stage] = StageStatus.PASSED
+
+
+def mark_failed(stage: int) -> None:
+    """Mark a stage as failed and record first failure if applicable.
+
+    When a stage fails, it is recorded as the first failure if no
+    previous failure exists. This triggers automatic skipping of
+    all subsequent stages.
+
+    Args:
+        stage: The stage number that failed.
+
+    Raises:
+        ValueError: If stage is not a valid stage number.
+    """
+    validate_stage(stage)
+    _stage_status[stage] = StageStatus.FAILED
+    if _first_failure is None:
+        _sync_first_failure()
+    if _first_failure is None:
+        # Check-then-set across workers is not atomic; two workers failing
+        # at once only race over which stage is reported as first.
+        _stage_status[_FIRST_FAILURE_INDEX] = stage
+        _record_first_failure(stage)
+
+
+def mark_skipped(stage: int) -> None:
+    """Mark a stage as skipped.
+
+    Args:
+        stage: The stage number to skip.
+
+    Raises:
+        ValueError: If stage is not a valid stage number.
+    """
+    validate_stage(stage)
+    _stage_status[stage] = StageStatus.SKIPPED
+
+
+def should_skip(stage: int) -> bool:
+    """Determine if a stage should be skipped based on prior failures.
+
+    Implements the business rule: if stage N fails, all stages > N
+    are automatically skipped. Under xdist, failures recorded by other
+    workers of the same run are taken into account as well.
+
+    Args:
+        stage: The stage number to check.
+
+    Returns:
+        True if the stage should be skipped, False otherwise.
+    """
+    if _first_failure is None:
+        _sync_first_failure()
+    return stage > _skip_threshold
+
+
+def get_first_failure() -> int | None:
+    """Get the stage number of the first failure.
+
+    Returns:
+        The first failing stage, or None if no stage has failed.
+    """
+    if _first_failure is None:
+        _sync_first_failure()
+    return _first_failure
+
+
+def get_status(stage: int) -> StageStatus:
+    """Get the status of a specific stage.
+
+    Args:
+        stage: The stage number to query.
+
+    Returns:
+        The status of the stage, or PENDING if not tracked yet.
+
+    Raises:
+        ValueError: If stage is not a valid stage number.
+    """
+    validate_stage(stage)
+    return _STATUSES[_stage_status[stage]]
+
+
+def reset() -> None:
+    """Reset all stage tracking state for test isolation.
+
+    Clears all stage statuses and resets the first failure to None. Under
+    xdist this clears the state shared with the other workers as well.
+    Useful for ensuring clean state between test runs.
+    """
+    global _first_failure, _skip_threshold
+    _stage_status[:] = bytes(len(_stage_status))
+    _first_failure = None
+    _skip_threshold = sys.maxsize
+
+
+class StageTracker:
+    """Backward-compatible view over the module-level stage tracking state.
+
+    Stage state lives in module globals and is updated through the
+    ``mark_passed``/``mark_failed``/``should_skip`` functions above. This
+    class is kept as a thin, stateless facade so existing callers of
+    ``StageTracker.get_instance()`` keep working; every instance reads and
+    writes the same shared state.
+
+    Attributes:
+        first_failure: Stage number of first failure (None if all passed).
+        stage_status: Snapshot list of stage statuses indexed by stage number
+            (index 0 is unused).
+
+    State Transitions:
+        PENDING -> PASSED (test passes)
+        PENDING -> FAILED (test fails)
+        PENDING -> SKIPPED (dependency failed)
+
+    See tests/e2e/test_stage_tracker.py for behavior examples.
+    """
+
+    # Stateless: no per-instance __dict__ is needed.
+    __slots__ = ()
+
+    @classmethod
+    def get_instance(cls) -> "StageTracker":
+        """Get the shared StageTracker view of the stage state.
+
+        Returns:
+            The module-level StageTracker instance.
+        """
+        return _TRACKER
+
+    @property
+    def first_failure(self) -> int | None:
+        """Stage number of the first failure, or None if none failed."""
+        return get_first_failure()
+
+    @property
+    def stage_status(self) -> list[StageStatus]:
+        """Stage statuses indexed by stage number (index 0 is unused)."""
+        return [_STATUSES[value] for value in _stage_status[:_FIRST_FAILURE_INDEX]]
+
+    mark_passed = staticmethod(mark_passed)
+    mark_failed = staticmethod(mark_failed)
+    mark_skipped = staticmethod(mark_skipped)
+    should_skip = staticmethod(should_skip)
+    get_status = staticmethod(get_status)
+    reset = staticmethod(reset)
+
+
+_TRACKER = StageTracker()
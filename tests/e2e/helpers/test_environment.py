@@ -4,10 +4,19 @@ This module provides utilities for managing test project lifecycle,
 including directory creation, fixture copying, and git initialization.
 """
 
+import functools
+import hashlib
+import os
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
+
+# Characters that may not appear in a project (directory) name
+_INVALID_NAME_CHARS = frozenset('/\\\0:*?"<>|')
 
 
 class E2EProject:
@@ -28,6 +37,12 @@ class E2EProject:
         fixture_dir: Source fixture directory (tests/fixtures/{project_name}/).
         output_dir: Base output directory (tests/e2e/output/).
         timestamp: Run timestamp in YYYYMMDD-HHMMSS format.
+        worker_id: Optional pytest-xdist worker id (e.g., "gw0") appended to
+            the project and log directory names so parallel workers never
+            share a directory.
+        copy_strategy: How directory trees are copied: "reflink" (default)
+            clones files copy-on-write where the filesystem supports it,
+            "copy" always copies file contents.
 
     Example:
         >>> project = E2EProject("todo-app", Path("/path/to/tests"))
@@ -37,7 +52,19 @@ class E2EProject:
         >>> print(f"Log file: {log_file}")
     """
 
-    def __init__(self, project_name: str, tests_root: Path) -> None:
+    # Supported values for copy_strategy
+    COPY_STRATEGIES = ("reflink", "copy")
+
+    # Main repository directories copied into every test project
+    _PLUGIN_COPIES = (".spectra", ".claude")
+
+    def __init__(
+        self,
+        project_name: str,
+        tests_root: Path,
+        worker_id: str | None = None,
+        copy_strategy: str = "reflink",
+    ) -> None:
         """Initialize the E2EProject.
 
         Args:
@@ -45,20 +72,29 @@ class E2EProject:
                 directory name (e.g., "todo-app").
             tests_root: Path to the tests directory root. Fixture and output
                 directories are resolved relative to this path.
+            worker_id: Optional pytest-xdist worker id. When set, it is
+                appended to the project and log directory names. Defaults
+                to None (single-process run).
+            copy_strategy: One of COPY_STRATEGIES. Defaults to "reflink".
 
         Raises:
-            ValueError: If project_name is empty or contains invalid characters.
+            ValueError: If project_name is empty or contains invalid characters,
+                or if copy_strategy is not supported.
         """
         if not project_name or not project_name.strip():
             raise ValueError("project_name cannot be empty")
 
-        # Basic validation for directory name
-        invalid_chars = ['/', '\\', '\0', ':', '*', '?', '"', '<', '>', '|']
-        for char in invalid_chars:
-            if char in project_name:
-                raise ValueError(
-                    f"project_name contains invalid character: '{char}'"
-                )
+        # Basic validation for directory name, in one pass over the name
+        invalid = _INVALID_NAME_CHARS.intersection(project_name)
+        if invalid:
+            char = next(c for c in project_name if c in invalid)
+            raise ValueError(f"project_name contains invalid character: '{char}'")
+
+        if copy_strategy not in self.COPY_STRATEGIES:
+            raise ValueError(
+                f"copy_strategy must be one of {self.COPY_STRATEGIES}, "
+                f"got '{copy_strategy}'"
+            )
 
         self.project_name = project_name
         self.tests_root = tests_root
@@ -67,18 +103,33 @@ class E2EProject:
         self.fixture_dir = tests_root / "fixtures" / project_name
         self.output_dir = tests_root / "e2e" / "output"
         self.timestamp: str = ""
+        self.worker_id = worker_id
+        self.copy_strategy = copy_strategy
         self.plugin_dir: Path | None = None
 
-    def setup(self) -> Path:
+    def setup(self, template_dir: Path | None = None) -> Path:
         """Create and initialize the test project directory.
 
         This method performs the following steps:
         1. Generates a timestamp for unique directory naming
-        2. Creates the log directory: tests_root/e2e/output/logs/{timestamp}/
-        3. Creates project directory: tests_root/e2e/output/test-projects/{timestamp}-{project_name}/
+        2. Creates project directory: tests_root/e2e/output/test-projects/{timestamp}-{project_name}/
+        3. Creates the log directory: tests_root/e2e/output/logs/{timestamp}/
+           (both names get a "-{worker_id}" suffix when worker_id is set,
+           and a "-{pid}" suffix if another run already took the name)
         4. Copies fixture files if the fixture directory exists
         5. Initializes a git repository
         6. Creates an initial commit
+        7. Copies the spectra plugin directories (.spectra/, .claude/)
+
+        When template_dir is given, steps 4-7 are replaced by copying the
+        template (fixture files, the initialized repository and the plugin
+        copies) if it exists. Otherwise they run as usual and their result
+        is saved to template_dir for later sessions.
+
+        Args:
+            template_dir: Optional directory caching the bootstrapped
+                project. Callers should key it on bootstrap_hash() so that
+                a changed fixture or plugin never reuses a stale template.
 
         Returns:
             Absolute path to the created project directory.
@@ -95,24 +146,48 @@ class E2EProject:
         # Generate timestamp
         self.timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
 
+        # Keep parallel xdist workers out of each other's directories
+        suffix = f"-{self.worker_id}" if self.worker_id else ""
+
+        # Create project directory. Creation is exclusive, so a separate
+        # run that started within the same second gets its own directory
+        # (and log directory) by adding its process id instead of reusing ours.
+        projects_dir = self.output_dir / "test-projects"
+        projects_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self.project_path = (
+                projects_dir / f"{self.timestamp}-{self.project_name}{suffix}"
+            )
+            self.project_path.mkdir()
+        except FileExistsError:
+            suffix += f"-{os.getpid()}"
+            self.project_path = (
+                projects_dir / f"{self.timestamp}-{self.project_name}{suffix}"
+            )
+            self.project_path.mkdir(exist_ok=True)
+
         # Create log directory
-        self.log_dir = self.output_dir / "logs" / self.timestamp
+        self.log_dir = self.output_dir / "logs" / f"{self.timestamp}{suffix}"
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create project directory
-        project_dir_name = f"{self.timestamp}-{self.project_name}"
-        self.project_path = self.output_dir / "test-projects" / project_dir_name
-        self.project_path.mkdir(parents=True, exist_ok=True)
+        if template_dir is not None and template_dir.is_dir():
+            # Reuse a previously bootstrapped project, plugin copies included
+            self._copy_tree(template_dir, self.project_path, symlinks=True)
+            self.plugin_dir = _find_spectra_plugin(self.tests_root) / "plugins"
+        else:
+            # Copy fixture files if they exist
+            has_fixture = self.fixture_dir.is_dir()
+            if has_fixture:
+                self._copy_fixture()
 
-        # Copy fixture files if they exist
-        if self.fixture_dir.exists() and self.fixture_dir.is_dir():
-            self._copy_fixture()
+            # Initialize git repository
+            self._init_git_repository(stage_files=has_fixture)
 
-        # Initialize git repository
-        self._init_git_repository()
+            # Locate spectra plugin directory
+            self._locate_spectra_plugin()
 
-        # Locate spectra plugin directory
-        self._locate_spectra_plugin()
+            if template_dir is not None:
+                self._save_template(template_dir)
 
         return self.project_path
 
@@ -125,62 +200,155 @@ class E2EProject:
         if self.project_path is None:
             return
 
-        for item in self.fixture_dir.iterdir():
-            src = item
-            dst = self.project_path / item.name
+        self._copy_tree(self.fixture_dir, self.project_path)
 
-            if item.is_dir():
-                shutil.copytree(src, dst)
+    def _copy_tree(self, src: Path, dst: Path, symlinks: bool = False) -> None:
+        """Copy the contents of src into dst, creating dst if needed.
+
+        With the "reflink" strategy the system cp is asked for copy-on-write
+        clones (``--reflink=auto`` on Linux, ``-c`` on macOS), so on
+        filesystems that support it (btrfs, XFS, APFS) only metadata is
+        written. Unlike hardlinks, clones are independent copies, so tests
+        may modify them freely. With the "copy" strategy, on other
+        platforms, or if cp fails, shutil.copytree is used.
+
+        Args:
+            src: Directory to copy from.
+            dst: Directory to copy into (may already exist).
+            symlinks: Copy symlinks as links instead of following them.
+        """
+        if self.copy_strategy == "reflink" and sys.platform in ("linux", "darwin"):
+            clone_flag = "--reflink=auto" if sys.platform == "linux" else "-c"
+            dst.mkdir(parents=True, exist_ok=True)
+            try:
+                result = subprocess.run(
+                    [
+                        "cp",
+                        "-R",
+                        "-p",
+                        "-P" if symlinks else "-L",
+                        clone_flag,
+                        f"{src}/.",
+                        str(dst),
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                pass
             else:
-                shutil.copy2(src, dst)
+                if result.returncode == 0:
+                    return
 
-    def _init_git_repository(self) -> None:
-        """Initialize a git repository and create an initial commit.
+        shutil.copytree(src, dst, symlinks=symlinks, dirs_exist_ok=True)
+
+    def _copy_trees(self, jobs: list[tuple[Path, Path]]) -> None:
+        """Run several independent _copy_tree() calls concurrently.
+
+        Copying is I/O bound and each copy either waits on a cp process or
+        on file system calls that release the GIL, so threads overlap them.
+
+        Args:
+            jobs: (src, dst) pairs with disjoint destinations.
 
         Raises:
-            RuntimeError: If git init or commit fails.
+            OSError: The first error raised by any of the copies.
+        """
+        if len(jobs) <= 1:
+            for src, dst in jobs:
+                self._copy_tree(src, dst)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as pool:
+            futures = [pool.submit(self._copy_tree, src, dst) for src, dst in jobs]
+        for future in futures:
+            future.result()
+
+    def bootstrap_hash(self) -> str:
+        """Compute a fingerprint of everything a bootstrapped project is built from.
+
+        Hashes the relative path, size and modification time of every file
+        under fixture_dir and under the main repository's plugin
+        directories (.spectra/, .claude/), which is enough to notice edits
+        without reading file contents.
+
+        Returns:
+            Hex digest identifying the current fixture and plugin contents.
+
+        Raises:
+            RuntimeError: If the spectra plugin directory cannot be found.
+
+        Example:
+            >>> project = E2EProject("todo-app", Path("/path/to/tests"))
+            >>> len(project.bootstrap_hash())
+            32
+        """
+        main_repo_root = _find_spectra_plugin(self.tests_root).parent
+        roots = [("fixture", self.fixture_dir)] + [
+            (name, main_repo_root / name) for name in _plugin_sources(main_repo_root)
+        ]
+
+        digest = hashlib.blake2b(digest_size=16)
+        for label, root in roots:
+            if not root.is_dir():
+                continue
+            for relative, stat in _walk_files(os.fspath(root)):
+                digest.update(
+                    f"{label}/{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+                )
+        return digest.hexdigest()
+
+    def _save_template(self, template_dir: Path) -> None:
+        """Save the freshly bootstrapped project as a reusable template.
+
+        The copy is built next to template_dir and renamed into place, so
+        concurrent sessions (e.g. xdist workers) never see a partial
+        template. If another session got there first, its template is kept.
+
+        Args:
+            template_dir: Destination directory for the template.
         """
         if self.project_path is None:
             return
 
-        # Initialize git repository
-        result = subprocess.run(
-            ["git", "init"],
-            cwd=self.project_path,
-            capture_output=True,
-            text=True,
-        )
+        tmp_dir = template_dir.with_name(f"{template_dir.name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        self._copy_tree(self.project_path, tmp_dir, symlinks=True)
+        try:
+            tmp_dir.rename(template_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"Failed to initialize git repository: {result.stderr}"
-            )
+    def _init_git_repository(self, stage_files: bool = True) -> None:
+        """Initialize a git repository and create an initial commit.
 
-        # Configure git user for commits (local to this repo)
-        subprocess.run(
-            ["git", "config", "user.email", "e2e-test@spectra.local"],
-            cwd=self.project_path,
-            capture_output=True,
-            text=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "E2E Test"],
-            cwd=self.project_path,
-            capture_output=True,
-            text=True,
-        )
+        Args:
+            stage_files: Stage the working tree before committing. Without
+                fixture files the project is empty, so the initial commit
+                is an empty one and ``git add`` can be skipped.
 
-        # Add all files if any exist
-        subprocess.run(
-            ["git", "add", "-A"],
-            cwd=self.project_path,
-            capture_output=True,
-            text=True,
-        )
+        Raises:
+            RuntimeError: If git init or commit fails.
+        """
+        if self.project_path is None:
+            return
 
-        # Create initial commit
+        # Run init, local user config, add and the initial commit in one
+        # shell, so bootstrapping costs a single process spawn instead of
+        # five. The chain stops at the first failing step. The user identity
+        # stays in the repository config, as Claude commits later rely on
+        # it, but it is appended by the printf builtin instead of two
+        # "git config" processes.
+        script = (
+            "git init"
+            " && printf '[user]\\n\\temail = e2e-test@spectra.local"
+            "\\n\\tname = E2E Test\\n' >> .git/config"
+        )
+        if stage_files:
+            script += " && git add -A"
+        script += " && git commit --allow-empty -m 'Initial commit for E2E test'"
         result = subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "Initial commit for E2E test"],
+            ["sh", "-c", script],
             cwd=self.project_path,
             capture_output=True,
             text=True,
@@ -188,7 +356,7 @@ class E2EProject:
 
         if result.returncode != 0:
             raise RuntimeError(
-                f"Failed to create initial commit: {result.stderr}"
+                f"Failed to initialize git repository: {result.stderr}"
             )
 
     def _locate_spectra_plugin(self) -> None:
@@ -204,26 +372,7 @@ class E2EProject:
         if self.project_path is None:
             return
 
-        # Determine the spectra plugin path
-        # The plugin is located at the repo root /spectra directory
-        # We need to find the repo root by going up from tests_root
-        repo_root = self.tests_root.parent
-        plugin_path = repo_root / "spectra"
-
-        # If running in a worktree, the plugin path may be different
-        # Check if the plugin exists at the expected path
-        if not plugin_path.exists():
-            # Try to find it relative to the worktree structure
-            # worktrees/XXX/tests -> ../../spectra
-            potential_path = self.tests_root.parent.parent.parent / "spectra"
-            if potential_path.exists():
-                plugin_path = potential_path
-
-        if not plugin_path.exists():
-            raise RuntimeError(
-                f"Could not find spectra plugin at {plugin_path}. "
-                "Ensure the spectra plugin directory exists."
-            )
+        plugin_path = _find_spectra_plugin(self.tests_root)
 
         # --plugin-dir expects the parent directory containing plugin folders
         # The plugin is at spectra/plugins/spectra/, so we pass spectra/plugins/
@@ -234,17 +383,13 @@ class E2EProject:
         # and plugin config in spectra/plugins/spectra/
         main_repo_root = plugin_path.parent
 
-        # Copy .spectra/ from main repo to test project
-        source_spectra = main_repo_root / ".spectra"
-        if source_spectra.exists():
-            dest_spectra = self.project_path / ".spectra"
-            shutil.copytree(source_spectra, dest_spectra, dirs_exist_ok=True)
-
-        # Copy .claude/ from main repo to test project (if exists)
-        source_claude = main_repo_root / ".claude"
-        if source_claude.exists():
-            dest_claude = self.project_path / ".claude"
-            shutil.copytree(source_claude, dest_claude, dirs_exist_ok=True)
+        # Copy .spectra/ and .claude/ (if they exist) from main repo to
+        # test project. The copies are independent, so they run in parallel.
+        jobs = [
+            (main_repo_root / name, self.project_path / name)
+            for name in _plugin_sources(main_repo_root)
+        ]
+        self._copy_trees(jobs)
 
     def get_log_file(self, stage: int, stage_name: str) -> Path:
         """Get the log file path for a specific stage.
@@ -275,3 +420,83 @@ class E2EProject:
 
         log_filename = f"{stage:02d}-{stage_name}.log"
         return self.log_dir / log_filename
+
+
+@functools.lru_cache(maxsize=None)
+def _find_spectra_plugin(tests_root: Path) -> Path:
+    """Find the spectra plugin directory of the repository under test.
+
+    The location never changes during a session, so it is resolved once
+    per tests_root and shared by all E2EProject instances.
+
+    Args:
+        tests_root: Path to the tests directory root.
+
+    Returns:
+        Path to the spectra/ directory holding the plugin.
+
+    Raises:
+        RuntimeError: If plugin directory cannot be found.
+    """
+    # Determine the spectra plugin path
+    # The plugin is located at the repo root /spectra directory
+    # We need to find the repo root by going up from tests_root
+    repo_root = tests_root.parent
+    plugin_path = repo_root / "spectra"
+
+    # If running in a worktree, the plugin path may be different
+    # Check if the plugin exists at the expected path
+    if not plugin_path.exists():
+        # Try to find it relative to the worktree structure
+        # worktrees/XXX/tests -> ../../spectra
+        potential_path = tests_root.parent.parent.parent / "spectra"
+        if potential_path.exists():
+            plugin_path = potential_path
+
+    if not plugin_path.exists():
+        raise RuntimeError(
+            f"Could not find spectra plugin at {plugin_path}. "
+            "Ensure the spectra plugin directory exists."
+        )
+
+    return plugin_path
+
+
+def _walk_files(
+    root: str, prefix: str = ""
+) -> "Iterator[tuple[str, os.stat_result]]":
+    """Yield every regular file under root with its stat result, in name order.
+
+    Uses os.scandir so the file type comes from the directory listing and
+    each file costs a single stat call.
+
+    Args:
+        root: Directory to walk.
+        prefix: Relative path of root, prepended to the yielded paths.
+
+    Yields:
+        (relative POSIX path, stat result) for each file.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        relative = prefix + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path, relative + "/")
+        elif entry.is_file():
+            yield relative, entry.stat()
+
+
+@functools.lru_cache(maxsize=None)
+def _plugin_sources(main_repo_root: Path) -> tuple[str, ...]:
+    """List the plugin directories present in the main repository, memoized.
+
+    Args:
+        main_repo_root: Repository root holding the spectra/ directory.
+
+    Returns:
+        Names from E2EProject._PLUGIN_COPIES that exist under main_repo_root.
+    """
+    return tuple(
+        name for name in E2EProject._PLUGIN_COPIES if (main_repo_root / name).is_dir()
+    )
@@ -6,9 +6,12 @@ These tests are the first stage in the E2E test pipeline and must pass
 before subsequent stages can run.
 """
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from ..helpers import ClaudeRunner, FileVerifier
+if TYPE_CHECKING:
+    from ..helpers import ClaudeRunner, FileVerifier
 
 
 @pytest.mark.e2e
@@ -26,7 +29,7 @@ class TestSpectraInit:
     constitution command and are tested in Stage 2.
     """
 
-    def test_01_plugin_discovered(self, claude_runner: ClaudeRunner) -> None:
+    def test_01_plugin_discovered(self, claude_runner: "ClaudeRunner") -> None:
         """Test that Claude Code discovers the spectra plugin.
 
         This test verifies that Claude Code can discover the spectra
@@ -50,7 +53,7 @@ class TestSpectraInit:
             f"STDERR:\n{result.stderr}"
         )
 
-    def test_02_claude_plugin_configured(self, file_verifier: FileVerifier) -> None:
+    def test_02_claude_plugin_configured(self, file_verifier: "FileVerifier") -> None:
         """Test that .claude/ directory contains plugin configuration.
 
         This test verifies that the .claude/ directory exists in the
@@ -5,9 +5,12 @@ the /spectra:constitution command properly creates and manages project
 constitution files with foundational principles and constraints.
 """
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from ..helpers import ClaudeRunner, FileVerifier
+if TYPE_CHECKING:
+    from ..helpers import ClaudeRunner, FileVerifier
 
 
 @pytest.mark.e2e
@@ -20,7 +23,7 @@ class TestSpectraConstitution:
     consistency with dependent templates.
     """
 
-    def test_01_constitution_setup(self, claude_runner: ClaudeRunner) -> None:
+    def test_01_constitution_setup(self, claude_runner: "ClaudeRunner") -> None:
         """Test that /spectra:constitution command executes successfully.
 
         This test verifies that the /spectra:constitution command can be
@@ -45,7 +48,7 @@ class TestSpectraConstitution:
             f"STDERR:\n{result.stderr}"
         )
 
-    def test_02_spectra_dir_exists(self, file_verifier: FileVerifier) -> None:
+    def test_02_spectra_dir_exists(self, file_verifier: "FileVerifier") -> None:
         """Test that .spectra/ directory exists after constitution setup.
 
         This test verifies that the .spectra/ directory is created by the
@@ -60,7 +63,7 @@ class TestSpectraConstitution:
             "spectra plugin configuration directory"
         )
 
-    def test_03_memory_dir_exists(self, file_verifier: FileVerifier) -> None:
+    def test_03_memory_dir_exists(self, file_verifier: "FileVerifier") -> None:
         """Test that .spectra/memory/ directory exists after constitution setup.
 
         This test verifies that the .spectra/memory/ directory is created by the
@@ -74,7 +77,7 @@ class TestSpectraConstitution:
             "spectra memory directory"
         )
 
-    def test_04_constitution_file_created(self, file_verifier: FileVerifier) -> None:
+    def test_04_constitution_file_created(self, file_verifier: "FileVerifier") -> None:
         """Test that constitution.md file is created in the correct location.
 
         This test verifies that running the /spectra:constitution command
@@ -5,9 +5,14 @@ command works correctly, including spec creation, content validation,
 and proper file structure generation.
 """
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from ..helpers import ClaudeRunner, FileVerifier, GitVerifier
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..helpers import ClaudeRunner, FileVerifier, GitVerifier
 
 
 @pytest.mark.e2e
@@ -19,7 +24,7 @@ class TestSpectraSpecify:
     generates feature specifications from natural language descriptions.
     """
 
-    def test_01_specify_runs_successfully(self, claude_runner: ClaudeRunner) -> None:
+    def test_01_specify_runs_successfully(self, claude_runner: "ClaudeRunner") -> None:
         """Test that /spectra:specify command executes successfully.
 
         This test runs the /spectra:specify command with a sample feature
@@ -46,7 +51,7 @@ class TestSpectraSpecify:
             f"Stdout (last 500 chars): {result.stdout[-500:] if result.stdout else 'empty'}"
         )
 
-    def test_02_feature_branch_created(self, git_verifier: GitVerifier) -> None:
+    def test_02_feature_branch_created(self, git_verifier: "GitVerifier") -> None:
         """Test that /spectra:specify creates a feature worktree.
 
         The /spectra:specify command should create a worktree with a numbered
@@ -61,7 +66,9 @@ class TestSpectraSpecify:
         )
 
     def test_03_spec_file_created(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        feature_worktree: "Path | None",
+        spec_file: "Path | None",
     ) -> None:
         """Test that spec.md file is created in the feature spec directory.
 
@@ -70,29 +77,25 @@ class TestSpectraSpecify:
         locates the worktree and verifies the spec file exists.
 
         Args:
-            file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            spec_file: Class-scoped path of spec.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree matching pattern 'worktrees/\\d+-.*'. "
             "The /spectra:specify command should have created a numbered worktree."
         )
 
-        # Find the spec.md file in the worktree's specs directory
-        spec_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/spec\.md",
-            base_path=worktree_path,
-        )
         assert spec_file is not None, (
-            f"spec.md not found in worktree at {worktree_path}. "
+            f"spec.md not found in worktree at {feature_worktree}. "
             "Expected a file matching pattern 'specs/<number>-<name>/spec.md'. "
             "The /spectra:specify command should create this file."
         )
 
     def test_04_spec_has_required_sections(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        file_verifier: "FileVerifier",
+        feature_worktree: "Path | None",
+        spec_file: "Path | None",
     ) -> None:
         """Test that spec.md contains required specification sections.
 
@@ -102,40 +105,25 @@ class TestSpectraSpecify:
 
         Args:
             file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            spec_file: Class-scoped path of spec.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree. "
             "This test depends on test_feature_branch_created passing."
         )
 
-        # Find the spec.md file
-        spec_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/spec\.md",
-            base_path=worktree_path,
-        )
         assert spec_file is not None, (
             "spec.md not found. This test depends on test_spec_file_created passing."
         )
 
         # Verify required sections exist
         # Use case-insensitive patterns since section headers may vary slightly
-        file_verifier.assert_contains(
-            path=spec_file,
-            pattern=r"(?i)#.*user\s+scenarios?",
-            description="User Scenarios section header",
-        )
-
-        file_verifier.assert_contains(
-            path=spec_file,
-            pattern=r"(?i)#.*requirements?",
-            description="Requirements section header",
-        )
-
-        file_verifier.assert_contains(
+        file_verifier.assert_contains_all(
             path=spec_file,
-            pattern=r"(?i)#.*success\s+criteria",
-            description="Success Criteria section header",
+            checks=[
+                (r"(?i)#.*user\s+scenarios?", "User Scenarios section header"),
+                (r"(?i)#.*requirements?", "Requirements section header"),
+                (r"(?i)#.*success\s+criteria", "Success Criteria section header"),
+            ],
         )
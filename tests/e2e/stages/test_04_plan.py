@@ -5,9 +5,14 @@ command works correctly, including plan creation, content validation,
 and proper technical context generation.
 """
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from ..helpers import ClaudeRunner, FileVerifier, GitVerifier
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..helpers import ClaudeRunner, FileVerifier
 
 
 @pytest.mark.e2e
@@ -20,7 +25,7 @@ class TestSpectraPlan:
     including technical context and project structure analysis.
     """
 
-    def test_01_plan_runs_successfully(self, claude_runner: ClaudeRunner) -> None:
+    def test_01_plan_runs_successfully(self, claude_runner: "ClaudeRunner") -> None:
         """Test that /spectra:plan command executes successfully.
 
         This test runs the /spectra:plan command on the feature spec
@@ -48,7 +53,9 @@ class TestSpectraPlan:
         )
 
     def test_02_plan_file_created(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        feature_worktree: "Path | None",
+        plan_file: "Path | None",
     ) -> None:
         """Test that plan.md file is created in the feature spec directory.
 
@@ -56,29 +63,25 @@ class TestSpectraPlan:
         the specs/<feature-id>/ directory in the feature worktree.
 
         Args:
-            file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            plan_file: Class-scoped path of plan.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree matching pattern 'worktrees/\\d+-.*'. "
             "The /spectra:specify command should have created a numbered worktree."
         )
 
-        # Find the plan.md file in the worktree's specs directory
-        plan_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/plan\.md",
-            base_path=worktree_path,
-        )
         assert plan_file is not None, (
-            f"plan.md not found in worktree at {worktree_path}. "
+            f"plan.md not found in worktree at {feature_worktree}. "
             "Expected a file matching pattern 'specs/<number>-<name>/plan.md'. "
             "The /spectra:plan command should create this file."
         )
 
     def test_03_plan_has_technical_context(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        file_verifier: "FileVerifier",
+        feature_worktree: "Path | None",
+        plan_file: "Path | None",
     ) -> None:
         """Test that plan.md contains a Technical Context section.
 
@@ -88,20 +91,14 @@ class TestSpectraPlan:
 
         Args:
             file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            plan_file: Class-scoped path of plan.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree. "
             "This test depends on earlier stage tests passing."
         )
 
-        # Find the plan.md file
-        plan_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/plan\.md",
-            base_path=worktree_path,
-        )
         assert plan_file is not None, (
             "plan.md not found. This test depends on test_plan_file_created passing."
         )
@@ -114,7 +111,10 @@ class TestSpectraPlan:
         )
 
     def test_04_plan_has_project_structure(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        file_verifier: "FileVerifier",
+        feature_worktree: "Path | None",
+        plan_file: "Path | None",
     ) -> None:
         """Test that plan.md contains a Project Structure section.
 
@@ -124,20 +124,14 @@ class TestSpectraPlan:
 
         Args:
             file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            plan_file: Class-scoped path of plan.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree. "
             "This test depends on earlier stage tests passing."
         )
 
-        # Find the plan.md file
-        plan_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/plan\.md",
-            base_path=worktree_path,
-        )
         assert plan_file is not None, (
             "plan.md not found. This test depends on test_plan_file_created passing."
         )
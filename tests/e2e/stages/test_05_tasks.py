@@ -5,9 +5,14 @@ command works correctly, including task generation, proper formatting,
 and phase organization.
 """
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from ..helpers import ClaudeRunner, FileVerifier, GitVerifier
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..helpers import ClaudeRunner, FileVerifier
 
 
 @pytest.mark.e2e
@@ -20,7 +25,7 @@ class TestSpectraTasks:
     including proper checkbox formatting and phase organization.
     """
 
-    def test_01_tasks_runs_successfully(self, claude_runner: ClaudeRunner) -> None:
+    def test_01_tasks_runs_successfully(self, claude_runner: "ClaudeRunner") -> None:
         """Test that /spectra:tasks command executes successfully.
 
         This test runs the /spectra:tasks command on the feature plan
@@ -48,7 +53,9 @@ class TestSpectraTasks:
         )
 
     def test_02_tasks_file_created(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        feature_worktree: "Path | None",
+        tasks_file: "Path | None",
     ) -> None:
         """Test that tasks.md file is created in the feature spec directory.
 
@@ -56,29 +63,25 @@ class TestSpectraTasks:
         the specs/<feature-id>/ directory in the feature worktree.
 
         Args:
-            file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            tasks_file: Class-scoped path of tasks.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree matching pattern 'worktrees/\\d+-.*'. "
             "The /spectra:specify command should have created a numbered worktree."
         )
 
-        # Find the tasks.md file in the worktree's specs directory
-        tasks_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/tasks\.md",
-            base_path=worktree_path,
-        )
         assert tasks_file is not None, (
-            f"tasks.md not found in worktree at {worktree_path}. "
+            f"tasks.md not found in worktree at {feature_worktree}. "
             "Expected a file matching pattern 'specs/<number>-<name>/tasks.md'. "
             "The /spectra:tasks command should create this file."
         )
 
     def test_03_tasks_has_checkboxes(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        file_verifier: "FileVerifier",
+        feature_worktree: "Path | None",
+        tasks_file: "Path | None",
     ) -> None:
         """Test that tasks.md contains task checkboxes.
 
@@ -88,20 +91,14 @@ class TestSpectraTasks:
 
         Args:
             file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            tasks_file: Class-scoped path of tasks.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree. "
             "This test depends on earlier stage tests passing."
         )
 
-        # Find the tasks.md file
-        tasks_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/tasks\.md",
-            base_path=worktree_path,
-        )
         assert tasks_file is not None, (
             "tasks.md not found. This test depends on test_tasks_file_created passing."
         )
@@ -118,7 +115,10 @@ class TestSpectraTasks:
         )
 
     def test_04_tasks_has_phases(
-        self, file_verifier: FileVerifier, git_verifier: GitVerifier
+        self,
+        file_verifier: "FileVerifier",
+        feature_worktree: "Path | None",
+        tasks_file: "Path | None",
     ) -> None:
         """Test that tasks.md contains phase sections.
 
@@ -127,20 +127,14 @@ class TestSpectraTasks:
 
         Args:
             file_verifier: Fixture providing a configured FileVerifier instance.
-            git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
+            tasks_file: Class-scoped path of tasks.md, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree. "
             "This test depends on earlier stage tests passing."
         )
 
-        # Find the tasks.md file
-        tasks_file = file_verifier.find_file(
-            pattern=r"specs/\d+-.*/tasks\.md",
-            base_path=worktree_path,
-        )
         assert tasks_file is not None, (
             "tasks.md not found. This test depends on test_tasks_file_created passing."
         )
@@ -5,9 +5,14 @@ command works correctly, executing tasks and producing implementation
 artifacts.
 """
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from ..helpers import ClaudeRunner, FileVerifier, GitVerifier
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..helpers import ClaudeRunner, GitVerifier
 
 
 @pytest.mark.e2e
@@ -19,16 +24,25 @@ class TestSpectraImplement:
     executes the generated tasks and produces implementation artifacts.
     """
 
-    def test_01_implement_runs_successfully(self, claude_runner: ClaudeRunner) -> None:
+    def test_01_implement_runs_successfully(
+        self, claude_runner: "ClaudeRunner", tasks_file: "Path | None"
+    ) -> None:
         """Test that /spectra:implement command executes successfully.
 
         This test runs the /spectra:implement command on the tasks
         generated in stage 5 and verifies that it completes without errors.
         Note: This stage has a longer timeout due to the implementation work.
+        It is skipped when there is no tasks.md to implement (e.g. when
+        stage 6 is run on its own), rather than running for minutes and
+        failing.
 
         Args:
             claude_runner: Fixture providing a configured ClaudeRunner instance.
+            tasks_file: Class-scoped path of tasks.md, or None.
         """
+        if tasks_file is None:
+            pytest.skip("No tasks.md from stage 5 in a feature worktree to implement")
+
         prompt = (
             "/spectra:implement --yes --direct. "
             "Important: The --yes flag means you MUST proceed without asking for confirmation. "
@@ -50,7 +64,9 @@ class TestSpectraImplement:
         )
 
     def test_02_implement_produces_code(
-        self, git_verifier: GitVerifier
+        self,
+        git_verifier: "GitVerifier",
+        feature_worktree: "Path | None",
     ) -> None:
         """Test that /spectra:implement produces implementation artifacts.
 
@@ -60,10 +76,9 @@ class TestSpectraImplement:
 
         Args:
             git_verifier: Fixture providing a configured GitVerifier instance.
+            feature_worktree: Class-scoped feature worktree path, or None.
         """
-        # Get the worktree path for the feature
-        worktree_path = git_verifier.get_worktree_path(pattern=r"worktrees/\d+-.*")
-        assert worktree_path is not None, (
+        assert feature_worktree is not None, (
             "Could not find feature worktree. "
             "This test depends on earlier stage tests passing."
         )
@@ -74,5 +89,5 @@ class TestSpectraImplement:
         git_verifier.assert_min_commits(
             count=1,
             message_pattern=r"\[T\d+\]",  # Task commit pattern
-            path=worktree_path,
+            path=feature_worktree,
         )
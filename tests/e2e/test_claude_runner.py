@@ -0,0 +1,118 @@
+"""Tests for the E2E Claude runner cache.
+
+These tests cover how CachedClaudeRunner archives and replays a project
+without calling the Claude CLI: cache keys must not depend on where the
+project lives, and a replay into another directory must leave its git
+worktrees usable.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from .helpers.claude_runner import CachedClaudeRunner, ClaudeResult
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give git a fixed identity and clock, so equal histories get equal SHAs.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "E2E")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "e2e@example.com")
+        monkeypatch.setenv(f"GIT_{role}_DATE", "2026-01-01T00:00:00+00:00")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    """Run a git command in cwd and return its stdout.
+
+    Args:
+        cwd: Directory to run git in.
+        *args: Arguments to git.
+
+    Returns:
+        The command's standard output.
+    """
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def _make_runner(tmp_path: Path, name: str) -> CachedClaudeRunner:
+    """Create a CachedClaudeRunner on an empty project directory.
+
+    Args:
+        tmp_path: Pytest temporary directory shared by the runners.
+        name: Name of the project directory.
+
+    Returns:
+        Runner whose cache lives in tmp_path/"cache".
+    """
+    work_dir = tmp_path / name
+    work_dir.mkdir()
+    return CachedClaudeRunner(
+        work_dir=work_dir, log_dir=tmp_path / "logs", cache_dir=tmp_path / "cache"
+    )
+
+
+def test_replay_relocates_worktrees(tmp_path: Path) -> None:
+    """A project replayed into another directory keeps working worktrees."""
+    source = _make_runner(tmp_path, "source")
+    _git(source.work_dir, "init", "-q", "-b", "main")
+    (source.work_dir / "README.md").write_text("# Project\n", encoding="utf-8")
+    _git(source.work_dir, "add", "README.md")
+    _git(source.work_dir, "commit", "-q", "-m", "Initial commit")
+    _git(source.work_dir, "worktree", "add", "-q", "worktrees/001-feature")
+    key = source._cache_key("prompt", stage=1)
+
+    result = ClaudeResult(
+        success=True,
+        stdout="done",
+        stderr="",
+        timed_out=False,
+        duration=0.0,
+        exit_code=0,
+        log_file=tmp_path / "logs" / "run.log",
+    )
+    source._store(key, result)
+
+    result_file = source.cache_dir / f"{key}.json"
+    cached = json.loads(result_file.read_text(encoding="utf-8"))
+    assert cached["work_dir"] == str(source.work_dir.resolve())
+
+    target = _make_runner(tmp_path, "target")
+    target._restore_work_dir(source.cache_dir / f"{key}.tar.gz", cached["work_dir"])
+
+    worktree = (target.work_dir / "worktrees" / "001-feature").resolve()
+    listing = _git(target.work_dir, "worktree", "list", "--porcelain")
+    assert f"worktree {worktree}\n" in listing
+    assert "prunable" not in listing
+    assert _git(worktree, "rev-parse", "--show-toplevel").strip() == str(worktree)
+
+    # The source project is left untouched
+    original = (source.work_dir / "worktrees" / "001-feature").resolve()
+    listing = _git(source.work_dir, "worktree", "list", "--porcelain")
+    assert f"worktree {original}\n" in listing
+
+
+def test_cache_key_ignores_project_location(tmp_path: Path) -> None:
+    """Identical projects with worktrees in different directories share a key."""
+    runners = [_make_runner(tmp_path, name) for name in ("first", "second")]
+    for runner in runners:
+        _git(runner.work_dir, "init", "-q", "-b", "main")
+        (runner.work_dir / "README.md").write_text("# Project\n", encoding="utf-8")
+        _git(runner.work_dir, "add", "README.md")
+        _git(runner.work_dir, "commit", "-q", "-m", "Initial commit")
+        _git(runner.work_dir, "worktree", "add", "-q", "worktrees/001-feature")
+
+    first, second = (runner._cache_key("prompt", stage=1) for runner in runners)
+    assert first == second
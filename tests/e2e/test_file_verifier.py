@@ -0,0 +1,188 @@
+"""Tests for the E2E file verifier.
+
+These tests cover FileVerifier's fast paths: byte-level and literal
+scanning must give the same results as searching the text that
+Path.read_text() returns, including non-ASCII text and "\\r" line
+endings, and find_file()'s literal tail prefilter must never hide a
+matching file.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from .helpers import file_verifier
+from .helpers.file_verifier import FileVerifier
+
+
+@pytest.fixture
+def verifier(tmp_path: Path) -> FileVerifier:
+    """Create a FileVerifier rooted in a temporary directory.
+
+    Args:
+        tmp_path: Pytest temporary directory.
+
+    Returns:
+        The verifier.
+    """
+    return FileVerifier(tmp_path)
+
+
+def _write(verifier: FileVerifier, name: str, content: bytes) -> str:
+    """Write a file under the verifier's base path.
+
+    Args:
+        verifier: Verifier whose base path receives the file.
+        name: File name.
+        content: Raw file contents.
+
+    Returns:
+        The file name, for passing to the verifier.
+    """
+    (verifier.base_path / name).write_bytes(content)
+    return name
+
+
+@pytest.mark.parametrize(
+    ("content", "pattern"),
+    [
+        ("## Überblick\n", r"(?i)überblick"),
+        ("name_é \n", r"name_\w\s"),
+        ("Título\n", r"^T.tulo"),
+        ("Über\n", "\\u00dc"),
+        ("done\r\n", r"done$"),
+    ],
+)
+def test_contains_matches_decoded_text(
+    verifier: FileVerifier, content: str, pattern: str
+) -> None:
+    """Patterns match characters and translated newlines, not raw bytes."""
+    name = _write(verifier, "doc.md", content.encode("utf-8"))
+    verifier.assert_contains(name, pattern, "Pattern")
+    verifier.assert_contains_all(name, [(pattern, "Pattern")])
+
+
+def test_count_pattern_counts_characters(verifier: FileVerifier) -> None:
+    """Word patterns count non-ASCII words as single words."""
+    content = "café naïve résumé déjà vu\n".encode("utf-8")
+    name = _write(verifier, "words.txt", content)
+    assert verifier.count_pattern(name, r"\w+") == 5
+    assert verifier.count_pattern(name, "é") == 4
+
+
+def test_invalid_utf8_fails_assertion(verifier: FileVerifier) -> None:
+    """Undecodable files are reported as assertion failures."""
+    name = _write(verifier, "binary.dat", b"\xff\xfe data\n")
+    with pytest.raises(AssertionError, match="Cannot read file"):
+        verifier.assert_contains(name, r"data", "Binary file")
+    with pytest.raises(AssertionError, match="Cannot read file"):
+        verifier.assert_min_lines(name, 1, "Binary file")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"one\ntwo\nthree",
+        b"one\r\ntwo\r\nthree\r\n",
+        b"one\rtwo\rthree",
+        b"one\vtwo\fthree",
+    ],
+)
+def test_min_lines_matches_splitlines(verifier: FileVerifier, content: bytes) -> None:
+    """Lines are counted like str.splitlines(), whatever the line endings."""
+    name = _write(verifier, "lines.txt", content)
+    verifier.assert_min_lines(name, 3, "Three lines")
+    with pytest.raises(AssertionError, match="found only 3 lines"):
+        verifier.assert_min_lines(name, 4, "Four lines")
+
+
+def test_unreachable_paths_count_as_missing(verifier: FileVerifier) -> None:
+    """Paths below a file or through a symlink loop are reported as missing."""
+    _write(verifier, "spec.md", b"# Spec\n")
+    (verifier.base_path / "loop").symlink_to("loop")
+    for path in ("spec.md/child.md", "loop/spec.md"):
+        with pytest.raises(AssertionError, match="was not found"):
+            verifier.assert_exists(path, "Unreachable file")
+        with pytest.raises(FileNotFoundError):
+            verifier.count_pattern(path, "Spec")
+
+
+@pytest.mark.parametrize(
+    ("pattern", "tail"),
+    [
+        (r"specs/\d+-.*/spec\.md", "/spec.md"),
+        (r"plan\.md$", "plan.md"),
+        (r"tasks\.md\$", "tasks.md$"),
+        (r"notes\\", "notes\\"),
+        (r"specs/\d+-.*/spec\x2emd", "md"),
+        (r"spec\056md", "md"),
+        (r"spec\u002emd", "md"),
+        (r"spec\N{FULL STOP}md", "md"),
+        (r"(spec)\1\.md", ".md"),
+        (r"spec\.md\Z", ""),
+        (r"specs?", ""),
+        (r"spec|plan", ""),
+        (r"(?i)spec\.md", ""),
+        (r"(?x) spec \. md", ""),
+        ("", ""),
+    ],
+)
+def test_literal_tail(pattern: str, tail: str) -> None:
+    """The tail is the literal text every match of the pattern ends with."""
+    assert file_verifier._literal_tail(pattern) == tail
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"specs/\d+-.*/spec\.md",
+        r"plan\.md$",
+        r"(?i)SPEC\.MD",
+        r"tasks?\.md",
+        r"spec\.md|plan\.md",
+        r"research\.md\Z",
+        r"node_modules/.*\.md",
+        r"specs/\d+-.*/spec\x2emd",
+        r"specs/001-auth/spec\056md",
+        r"plan\N{FULL STOP}md",
+    ],
+)
+def test_find_file_matches_full_scan(verifier: FileVerifier, pattern: str) -> None:
+    """The literal tail prefilter never hides a file the regex matches."""
+    paths = [
+        "README.md",
+        "specs/001-auth/spec.md",
+        "specs/001-auth/plan.md",
+        "specs/001-auth/research.md",
+        "specs/002-api/tasks.md",
+        "node_modules/pkg/notes.md",
+    ]
+    for path in paths:
+        (verifier.base_path / path).parent.mkdir(parents=True, exist_ok=True)
+        _write(verifier, path, b"")
+
+    found = verifier.find_file(pattern)
+    assert found is not None
+    assert re.search(pattern, found.relative_to(verifier.base_path).as_posix())
+
+
+@pytest.mark.parametrize(
+    ("content", "pattern", "count"),
+    [
+        (b"- [ ] T001\n- [x] T002\n- [ ] T003\n", "- [ ]", 0),
+        (b"- [ ] T001\n- [x] T002\n- [ ] T003\n", r"- \[ \]", 2),
+        (b"aaaa", "aa", 2),
+        (b"TODO: a\nTODO: b\n", "TODO", 2),
+        (b"naive\n", "naïve", 0),
+        ("naïve naïve\n".encode("utf-8"), "naïve", 2),
+        (b"", "x", 0),
+    ],
+)
+def test_count_pattern_fast_paths(
+    verifier: FileVerifier, content: bytes, pattern: str, count: int
+) -> None:
+    """Literal and byte-level counting agree with re.findall on the text."""
+    name = _write(verifier, "count.md", content)
+    assert count == len(re.findall(pattern, content.decode("utf-8")))
+    assert verifier.count_pattern(name, pattern) == count
@@ -0,0 +1,97 @@
+"""Tests for the E2E git verifier.
+
+These tests cover GitVerifier's batched repository snapshot: the
+NUL-delimited output of the single shell call must be split back into
+the exit status and output of each git command, for repositories in
+every state the assertions distinguish.
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from .helpers.git_verifier import GitVerifier
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give git a fixed identity, so commits work without user config.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "E2E")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "e2e@example.com")
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run a git command in cwd, failing the test if it fails.
+
+    Args:
+        cwd: Directory to run git in.
+        *args: Arguments to git.
+    """
+    subprocess.run(["git", *args], cwd=cwd, capture_output=True, check=True)
+
+
+def test_snapshot_outside_repository(tmp_path: Path) -> None:
+    """Outside a repository every field carries git's failure."""
+    snapshot = GitVerifier(tmp_path)._snapshot()
+
+    status, output = snapshot.is_inside_work_tree
+    assert status != 0
+    assert "not a git repository" in output
+    assert snapshot.commit_count[0] != 0
+
+
+def test_snapshot_without_commits(tmp_path: Path) -> None:
+    """A fresh repository has a branch but no countable HEAD."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    snapshot = GitVerifier(tmp_path)._snapshot()
+
+    assert snapshot.is_inside_work_tree == (0, "true")
+    assert snapshot.current_branch == (0, "main")
+    assert snapshot.commit_count[0] != 0
+
+
+def test_snapshot_with_commits(tmp_path: Path) -> None:
+    """Each field holds its own command's status and stripped output."""
+    _git(tmp_path, "init", "-q", "-b", "001-feature")
+    for message in ("First commit", "Second commit"):
+        _git(tmp_path, "commit", "-q", "--allow-empty", "-m", message)
+    verifier = GitVerifier(tmp_path)
+    snapshot = verifier._snapshot()
+
+    assert snapshot.is_inside_work_tree == (0, "true")
+    assert snapshot.current_branch == (0, "001-feature")
+    assert snapshot.commit_count == (0, "2")
+    verifier.assert_is_repo()
+    verifier.assert_min_commits(2)
+
+
+def test_snapshot_ignores_warnings(tmp_path: Path) -> None:
+    """Warnings git prints on stderr while succeeding are not parsed as output."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "First commit")
+    # A branch named HEAD makes "git rev-list HEAD" warn but succeed
+    _git(tmp_path, "update-ref", "refs/heads/HEAD", "HEAD")
+    verifier = GitVerifier(tmp_path)
+
+    assert verifier._snapshot().commit_count == (0, "1")
+    assert verifier.get_commit_count() == 1
+    verifier.assert_min_commits(1)
+
+
+def test_refresh_rereads_snapshot(tmp_path: Path) -> None:
+    """The snapshot is cached until refresh() is called."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "First commit")
+    verifier = GitVerifier(tmp_path)
+    assert verifier._snapshot().commit_count == (0, "1")
+
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Second commit")
+    assert verifier._snapshot().commit_count == (0, "1")
+    verifier.refresh()
+    assert verifier._snapshot().commit_count == (0, "2")
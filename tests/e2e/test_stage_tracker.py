@@ -0,0 +1,124 @@
+"""Tests for the E2E stage dependency tracker.
+
+These tests cover the behavior of helpers.stage_tracker that the E2E
+hooks in conftest.py rely on: recording stage results, remembering the
+first failure, and skipping every later stage.
+"""
+
+import sys
+
+import pytest
+
+from .helpers import stage_tracker
+from .helpers.stage_tracker import StageStatus, StageTracker
+
+
+@pytest.fixture(autouse=True)
+def isolated_tracker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test private tracker state.
+
+    The tracker state is module-global and, under pytest-xdist, may be
+    shared with the worker running the E2E stages. Swapping in fresh
+    globals (restored by monkeypatch afterwards) keeps these tests from
+    touching that state.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        stage_tracker,
+        "_stage_status",
+        bytearray(len(stage_tracker._stage_status)),
+    )
+    monkeypatch.setattr(stage_tracker, "_first_failure", None)
+    monkeypatch.setattr(stage_tracker, "_skip_threshold", sys.maxsize)
+
+
+def test_stages_after_failure_are_skipped() -> None:
+    """A failing stage skips every later stage, but not itself or earlier ones."""
+    tracker = StageTracker.get_instance()
+    tracker.mark_passed(1)
+    tracker.mark_failed(2)
+
+    assert not tracker.should_skip(1)
+    assert not tracker.should_skip(2)
+    for stage in range(3, 7):
+        assert tracker.should_skip(stage)
+
+
+def test_nothing_skipped_without_failure() -> None:
+    """Passing stages never cause skips."""
+    tracker = StageTracker.get_instance()
+    tracker.mark_passed(1)
+    tracker.mark_passed(2)
+
+    assert not any(tracker.should_skip(stage) for stage in range(1, 7))
+
+
+def test_first_failure_not_overwritten() -> None:
+    """Only the first failure is recorded, even if an earlier stage fails later."""
+    tracker = StageTracker.get_instance()
+    assert tracker.first_failure is None
+
+    tracker.mark_failed(2)
+    assert tracker.first_failure == 2
+
+    tracker.mark_failed(4)
+    tracker.mark_failed(1)
+    assert tracker.first_failure == 2
+
+
+def test_statuses_are_recorded() -> None:
+    """Each mark_* call records the matching StageStatus."""
+    tracker = StageTracker.get_instance()
+    tracker.mark_passed(1)
+    tracker.mark_failed(2)
+    tracker.mark_skipped(3)
+
+    assert tracker.get_status(1) is StageStatus.PASSED
+    assert tracker.get_status(2) is StageStatus.FAILED
+    assert tracker.get_status(3) is StageStatus.SKIPPED
+    assert tracker.get_status(4) is StageStatus.PENDING
+    assert tracker.stage_status[1:4] == [
+        StageStatus.PASSED,
+        StageStatus.FAILED,
+        StageStatus.SKIPPED,
+    ]
+
+
+def test_reset_clears_state() -> None:
+    """reset() clears statuses and the first failure."""
+    tracker = StageTracker.get_instance()
+    tracker.mark_failed(2)
+    tracker.reset()
+
+    assert tracker.first_failure is None
+    assert tracker.get_status(2) is StageStatus.PENDING
+    assert not tracker.should_skip(3)
+
+
+def test_instances_share_state() -> None:
+    """Every StageTracker view reads and writes the same state."""
+    StageTracker().mark_failed(3)
+
+    assert StageTracker.get_instance().first_failure == 3
+    assert stage_tracker.should_skip(4)
+
+
+def test_invalid_stages_are_rejected() -> None:
+    """Out-of-range stages raise instead of corrupting or misreading the state."""
+    stage_tracker.mark_failed(2)
+
+    for stage in (0, 7, 8):
+        for mark in (
+            stage_tracker.mark_passed,
+            stage_tracker.mark_failed,
+            stage_tracker.mark_skipped,
+        ):
+            with pytest.raises(ValueError, match="Invalid stage"):
+                mark(stage)
+        with pytest.raises(ValueError, match="Invalid stage"):
+            stage_tracker.get_status(stage)
+
+    assert stage_tracker.get_first_failure() == 2
+    assert bytes(stage_tracker._stage_status) == bytes([0, 0, 2, 0, 0, 0, 0, 2])